@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Network path benchmarks for Persona Kit CLI.
+
+Builds template archives of several sizes, publishes them through the bundled
+local release server (src/persona_kit_cli/release_server.py) and measures
+release metadata fetches, download throughput and extraction time. Nothing
+leaves the machine, so this runs in CI without internet access.
+
+Usage:
+    python benchmarks/bench_network.py --sizes 64K,4M,32M --repeat 5 --json results.json
+"""
+
+import os
+import sys
+import json
+import time
+import zipfile
+import shutil
+import tempfile
+import statistics
+from pathlib import Path
+from typing import Callable, Dict, List
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+console = Console()
+
+app = typer.Typer(add_completion=False)
+
+FILE_SIZE = 64 * 1024  # template members are written in files of this size
+
+def parse_size(text: str) -> int:
+    """Parse sizes like 512, 64K or 32M into bytes."""
+    text = text.strip().upper()
+    units = {"K": 1024, "M": 1024 ** 2, "G": 1024 ** 3}
+    if text and text[-1] in units:
+        return int(float(text[:-1]) * units[text[-1]])
+    return int(text)
+
+def build_template(path: Path, size: int) -> int:
+    """Write a template-shaped zip holding ``size`` bytes of members; returns the member count.
+
+    Half of each member is random (incompressible) and half repeated text, so
+    deflate has real work and the archive ends up at roughly half of ``size``.
+    """
+    members = max(1, size // FILE_SIZE)
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr(".persona-kit/scripts/bash/setup.sh", "#!/bin/sh\necho setup\n")
+        for i in range(members):
+            chunk = min(FILE_SIZE, size - i * FILE_SIZE) if i < members - 1 else max(size - i * FILE_SIZE, 1)
+            half = chunk // 2
+            body = os.urandom(half) + (b"persona-kit template line\n" * (chunk // 26 + 1))[: chunk - half]
+            zf.writestr(f".persona-kit/templates/part-{i:05d}.md", body)
+    return members + 1
+
+def measure(fn: Callable[[], None], repeat: int) -> List[float]:
+    """Run ``fn`` ``repeat`` times and return wall-clock durations in seconds."""
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        durations.append(time.perf_counter() - start)
+    return durations
+
+@app.command()
+def main(
+    sizes: str = typer.Option("64K,4M,32M", "--sizes", help="Comma-separated template sizes (K/M/G suffixes)"),
+    repeat: int = typer.Option(5, "--repeat", min=1, help="Runs per measurement; the median is reported"),
+    segments: int = typer.Option(4, "--segments", min=1, help="Range segments for the segmented download measurement"),
+    delay: float = typer.Option(0.0, "--delay", min=0.0, help="Seconds of latency the server adds to each request"),
+    json_path: Path = typer.Option(None, "--json", help="Also write the results to this JSON file"),
+):
+    """Benchmark metadata fetch, download throughput and extraction against a local release server."""
+    work = Path(tempfile.mkdtemp(prefix="persona-kit-bench-"))
+    try:
+        run_benchmarks(work, [s.strip() for s in sizes.split(",") if s.strip()], repeat, segments, delay, json_path)
+    finally:
+        shutil.rmtree(work, ignore_errors=True)
+
+def run_benchmarks(work: Path, sizes: List[str], repeat: int, segments: int, delay: float, json_path: Path = None) -> None:
+    """Build fixtures under ``work``, run every measurement and print the results."""
+    os.environ["PERSONA_KIT_CACHE_DIR"] = str(work / "cache")
+
+    from src.persona_kit_cli import GITHUB_API_ENV, create_http_client, download_file, extract_template_members, get_release_data
+    from src.persona_kit_cli.release_server import ReleaseFixture, ReleaseServer
+
+    fixture_dir = work / "fixture"
+    fixture_dir.mkdir()
+    templates = {}
+    for label in sizes:
+        name = f"persona-kit-template-bench{label.lower()}-sh-v0.0.0.zip"
+        templates[label] = {"name": name, "members": build_template(fixture_dir / name, parse_size(label))}
+
+    results: Dict[str, Dict[str, float]] = {}
+    with ReleaseServer(ReleaseFixture(fixture_dir), delay=delay) as server, create_http_client() as client:
+        os.environ[GITHUB_API_ENV] = server.base_url
+
+        fetch = lambda **kw: get_release_data("Nom-nom-hub", "persona-kit", client, verbose=False, **kw)
+        release = fetch(refresh=True)
+        results["metadata"] = {
+            "full_ms": statistics.median(measure(lambda: fetch(refresh=True), repeat)) * 1000,
+            "revalidated_ms": statistics.median(measure(lambda: fetch(ttl=0), repeat)) * 1000,
+        }
+
+        assets = {a["name"]: a for a in release["assets"]}
+        for label, template in templates.items():
+            asset = assets[template["name"]]
+            archive = work / template["name"]
+            row = {"size_bytes": asset["size"], "members": template["members"]}
+            for n in sorted({1, segments}):
+                def download(n=n):
+                    archive.unlink(missing_ok=True)
+                    download_file(client, asset["browser_download_url"], archive, show_progress=False, segments=n)
+                seconds = statistics.median(measure(download, repeat))
+                row[f"download_{n}_mib_s"] = asset["size"] / seconds / 1024 ** 2
+
+            def extract():
+                dest = Path(tempfile.mkdtemp(dir=work))
+                with zipfile.ZipFile(archive) as zf:
+                    extract_template_members(zf, dest)
+            row["extract_ms"] = statistics.median(measure(extract, repeat)) * 1000
+            results[label] = row
+
+    table = Table(title=f"Persona Kit network benchmarks (median of {repeat})")
+    table.add_column("Template")
+    table.add_column("Size", justify="right")
+    for n in sorted({1, segments}):
+        table.add_column(f"Download x{n} MiB/s", justify="right")
+    table.add_column("Extract ms", justify="right")
+    for label in templates:
+        row = results[label]
+        table.add_row(label, f"{row['size_bytes']:,}", *(f"{row[f'download_{n}_mib_s']:.1f}" for n in sorted({1, segments})), f"{row['extract_ms']:.1f}")
+    console.print(table)
+    console.print(f"Release metadata: {results['metadata']['full_ms']:.1f} ms full, {results['metadata']['revalidated_ms']:.1f} ms revalidated (304)")
+
+    if json_path:
+        json_path.write_text(json.dumps(results, indent=2), encoding="utf-8")
+        console.print(f"[cyan]Results written to[/cyan] {json_path}")
+
+if __name__ == "__main__":
+    app()
@@ -5,6 +5,7 @@
 #     "typer",
 #     "rich",
 #     "platformdirs",
+#     "pyyaml",
 #     "readchar",
 #     "httpx",
 # ]
@@ -33,28 +34,164 @@ import tempfile
 import shutil
 import shlex
 import json
+import zlib
+import hashlib
+import importlib
+import contextlib
+import time
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import TYPE_CHECKING, BinaryIO, Optional, Tuple, Union
 
 import typer
-import httpx
 from rich.console import Console
 from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.text import Text
-from rich.live import Live
 from rich.align import Align
 from rich.table import Table
 from rich.tree import Tree
-from typer.core import TyperGroup
+from typer.core import TyperCommand, TyperGroup
+
+# httpx, truststore, readchar and rich.live/rich.progress are imported inside the
+# functions that need them so that `--help`, `check` and the subcommand groups
+# don't pay for the network stack at startup.
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+    import httpx
+    from .sources import TemplateSource
+
+_ssl_context = None
+
+def get_ssl_context():
+    """Return the shared truststore-backed SSL context, creating it on first use."""
+    global _ssl_context
+    if _ssl_context is None:
+        import ssl
+        import truststore
+        _ssl_context = truststore.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+    return _ssl_context
+
+HTTP2_ENV = "PERSONA_KIT_HTTP2"
+# Idle connections are kept this long so the API connection survives the
+# interactive prompts and the connection to the asset host (the redirect target
+# of release downloads) is reused from the checksum manifest to the template.
+KEEPALIVE_EXPIRY = 90.0
+DEFAULT_MAX_CONNECTIONS = 10
+
+def http2_enabled() -> bool:
+    """Return True if clients should negotiate HTTP/2.
+
+    HTTP/2 needs the optional ``h2`` package (``pip install persona-kit[http2]``)
+    and is used whenever it is installed, unless PERSONA_KIT_HTTP2=0.
+    """
+    import importlib.util
+    if os.getenv(HTTP2_ENV, "").strip().lower() in ("0", "false", "no", "off"):
+        return False
+    return importlib.util.find_spec("h2") is not None
+
+class ConnectionStats:
+    """Per-host request counts and connection setup times, collected from httpcore trace events.
+
+    Attach it with ``create_http_client(stats=...)``; ``render`` builds the
+    table shown by ``--debug``. Requests that open no connection reused a
+    pooled one.
+    """
+
+    def __init__(self):
+        import threading
+        self._lock = threading.Lock()
+        self.hosts: dict = {}
 
-# For cross-platform keyboard input
-import readchar
-import ssl
-import truststore
+    def _host(self, host: str) -> dict:
+        return self.hosts.setdefault(host, {"requests": 0, "connections": 0, "connect_ms": 0.0, "tls_ms": 0.0, "http_version": None})
 
-ssl_context = truststore.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
-client = httpx.Client(verify=ssl_context)
+    def _tracer(self, host: str, asynchronous: bool):
+        started = {}
+
+        def trace(event: str, info: dict) -> None:
+            name, _, phase = event.rpartition(".")
+            if phase == "started":
+                started[name] = time.perf_counter()
+                return
+            if phase != "complete" or name not in started:
+                return
+            elapsed_ms = (time.perf_counter() - started.pop(name)) * 1000
+            with self._lock:
+                entry = self._host(host)
+                if name == "connection.connect_tcp":
+                    entry["connections"] += 1
+                    entry["connect_ms"] += elapsed_ms
+                elif name == "connection.start_tls":
+                    entry["tls_ms"] += elapsed_ms
+
+        if not asynchronous:
+            return trace
+
+        # httpcore's async connections await the trace callback
+        async def atrace(event: str, info: dict) -> None:
+            trace(event, info)
+
+        return atrace
+
+    def on_request(self, request, asynchronous: bool = False) -> None:
+        host = request.url.netloc.decode("ascii")
+        with self._lock:
+            self._host(host)["requests"] += 1
+        request.extensions["trace"] = self._tracer(host, asynchronous)
+
+    def on_response(self, response) -> None:
+        with self._lock:
+            self._host(response.request.url.netloc.decode("ascii"))["http_version"] = response.http_version
+
+    def render(self) -> Table:
+        table = Table(title="Connections", show_edge=False, box=None, padding=(0, 2))
+        for column in ("Host", "HTTP", "Requests", "Opened", "TCP", "TLS"):
+            table.add_column(column, justify="left" if column in ("Host", "HTTP") else "right", no_wrap=column == "Host")
+        with self._lock:
+            for host, entry in self.hosts.items():
+                table.add_row(host, entry["http_version"] or "-", str(entry["requests"]), str(entry["connections"]), f"{entry['connect_ms']:.1f} ms", f"{entry['tls_ms']:.1f} ms")
+        return table
+
+def _http_client_options(verify: bool, max_connections: Optional[int]) -> dict:
+    import httpx
+    connections = max(max_connections or 0, DEFAULT_MAX_CONNECTIONS)
+    return {
+        "verify": get_ssl_context() if verify else False,
+        "http2": http2_enabled(),
+        "limits": httpx.Limits(max_connections=connections, max_keepalive_connections=connections, keepalive_expiry=KEEPALIVE_EXPIRY),
+    }
+
+def create_http_client(verify: bool = True, *, max_connections: Optional[int] = None, stats: Optional[ConnectionStats] = None) -> "httpx.Client":
+    """Create the pooled httpx client shared by every request of a command.
+
+    Uses the system trust store (or no verification), HTTP/2 when available
+    (see http2_enabled) and long-lived keep-alive (see KEEPALIVE_EXPIRY).
+    ``max_connections`` raises the pool size for concurrent callers; ``stats``
+    records connection setup times.
+    """
+    import httpx
+    hooks = {"request": [stats.on_request], "response": [stats.on_response]} if stats else None
+    return httpx.Client(**_http_client_options(verify, max_connections), event_hooks=hooks)
+
+def create_async_http_client(verify: bool = True, *, max_connections: Optional[int] = None, stats: Optional[ConnectionStats] = None) -> "httpx.AsyncClient":
+    """Async counterpart of create_http_client, with the same pool and protocol settings."""
+    import httpx
+    hooks = None
+    if stats:
+        async def on_request(request):
+            stats.on_request(request, asynchronous=True)
+
+        async def on_response(response):
+            stats.on_response(response)
+
+        hooks = {"request": [on_request], "response": [on_response]}
+    return httpx.AsyncClient(**_http_client_options(verify, max_connections), event_hooks=hooks, follow_redirects=True, timeout=60)
+
+GITHUB_API_ENV = "PERSONA_KIT_GITHUB_API_URL"
+DEFAULT_GITHUB_API_URL = "https://api.github.com"
+
+def github_api_url() -> str:
+    """Return the GitHub API base URL; PERSONA_KIT_GITHUB_API_URL points it elsewhere (e.g. a local release server)."""
+    return (os.getenv(GITHUB_API_ENV, "").strip() or DEFAULT_GITHUB_API_URL).rstrip("/")
 
 def _github_token(cli_token: str | None = None) -> str | None:
     """Return sanitized GitHub token (cli arg takes precedence) or None."""
@@ -249,6 +386,8 @@ class StepTracker:
 
 def get_key():
     """Get a single keypress in a cross-platform way using readchar."""
+    import readchar
+
     key = readchar.readkey()
 
     if key == readchar.key.UP or key == readchar.key.CTRL_P:
@@ -279,6 +418,8 @@ def select_with_arrows(options: dict, prompt_text: str = "Select an option", def
     Returns:
         Selected option key
     """
+    from rich.live import Live
+
     option_keys = list(options.keys())
     if default_key and default_key in option_keys:
         selected_index = option_keys.index(default_key)
@@ -344,13 +485,53 @@ def select_with_arrows(options: dict, prompt_text: str = "Select an option", def
 
 console = Console()
 
+# Subcommand groups registered by name -> (module, short help). Modules are only
+# imported when their subcommand is actually invoked.
+LAZY_SUBCOMMANDS = {
+    "constitution": ("constitution", "Establish project principles and foundational guidelines"),
+    "personas": ("personas", "Manage team personas and communication styles"),
+    "patterns": ("patterns", "Manage communication and decision-making patterns"),
+    "workflows": ("workflows", "Manage development workflows and processes"),
+    "implement": ("implement", "Execute implementation tasks and manage development processes"),
+    "cache": ("cache", "Manage the local template cache"),
+    "upgrade": ("upgrade", "Upgrade a project to the latest template release"),
+}
+
+def load_subcommand(name: str):
+    """Import a lazily registered subcommand module and build its click command."""
+    module_name, _ = LAZY_SUBCOMMANDS[name]
+    module = importlib.import_module(f".{module_name}", __name__)
+    command = typer.main.get_command(module.app)
+    command.name = name
+    return command
+
 class BannerGroup(TyperGroup):
-    """Custom group that shows banner before help."""
+    """Custom group that shows banner before help and loads subcommand groups lazily."""
+
+    _listing_commands = False
 
     def format_help(self, ctx, formatter):
         # Show banner before help
         show_banner()
-        super().format_help(ctx, formatter)
+        # Help only needs names and short help, so don't import the lazy modules
+        self._listing_commands = True
+        try:
+            super().format_help(ctx, formatter)
+        finally:
+            self._listing_commands = False
+
+    def list_commands(self, ctx):
+        commands = super().list_commands(ctx)
+        return commands + [name for name in LAZY_SUBCOMMANDS if name not in commands]
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name in self.commands or cmd_name not in LAZY_SUBCOMMANDS:
+            return super().get_command(ctx, cmd_name)
+        if self._listing_commands:
+            return TyperCommand(cmd_name, help=LAZY_SUBCOMMANDS[cmd_name][1])
+        command = load_subcommand(cmd_name)
+        self.commands[cmd_name] = command
+        return command
 
 app = typer.Typer(
     name="persona-kit",
@@ -425,20 +606,8 @@ def is_git_repo(path: Path = None) -> bool:
     if path is None:
         path = Path.cwd()
 
-    if not path.is_dir():
-        return False
-
-    try:
-        # Use git command to check if inside a work tree
-        subprocess.run(
-            ["git", "rev-parse", "--is-inside-work-tree"],
-            check=True,
-            capture_output=True,
-            cwd=path,
-        )
-        return True
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        return False
+    from .git_backend import GitBackend
+    return GitBackend(path).is_repo()
 
 def init_git_repo(project_path: Path, quiet: bool = False) -> Tuple[bool, Optional[str]]:
     """Initialize a git repository in the specified path.
@@ -451,13 +620,10 @@ def init_git_repo(project_path: Path, quiet: bool = False) -> Tuple[bool, Option
         Tuple of (success: bool, error_message: Optional[str])
     """
     try:
-        original_cwd = Path.cwd()
-        os.chdir(project_path)
         if not quiet:
             console.print("[cyan]Initializing git repository...[/cyan]")
-        subprocess.run(["git", "init"], check=True, capture_output=True, text=True)
-        subprocess.run(["git", "add", "."], check=True, capture_output=True, text=True)
-        subprocess.run(["git", "commit", "-m", "Initial commit from Persona Kit template"], check=True, capture_output=True, text=True)
+        from .git_backend import GitBackend
+        GitBackend(project_path).init_repo("Initial commit from Persona Kit template")
         if not quiet:
             console.print("[green]✓[/green] Git repository initialized")
         return True, None
@@ -472,161 +638,189 @@ def init_git_repo(project_path: Path, quiet: bool = False) -> Tuple[bool, Option
         if not quiet:
             console.print(f"[red]Error initializing git repository:[/red] {e}")
         return False, error_msg
-    finally:
-        os.chdir(original_cwd)
 
-def download_template_from_github(ai_assistant: str, download_dir: Path, *, script_type: str = "sh", verbose: bool = True, show_progress: bool = True, client: httpx.Client = None, debug: bool = False, github_token: str = None, repo_owner: str = "Nom-nom-hub", repo_name: str = "persona-kit") -> Tuple[Path, dict]:
-    """Download template from GitHub releases."""
+def get_release_data(repo_owner: str, repo_name: str, client: "httpx.Client", github_token: str = None, verbose: bool = True, *, refresh: bool = False, ttl: Optional[int] = None, raise_errors: bool = False, url: Optional[str] = None, auth_headers: Optional[dict] = None) -> dict:
+    """Fetch release data from GitHub API.
+
+    Responses are cached with their ETag/Last-Modified validators. A cached
+    response younger than ``ttl`` seconds is used as-is; older ones are
+    revalidated with a conditional request and reused on 304 Not Modified.
+    ``refresh`` bypasses the cache and always performs a full request.
+    Failures are reported and end the command unless ``raise_errors`` is
+    set, in which case the underlying exception propagates silently.
+    ``url`` fetches the release document from elsewhere (e.g. a mirror's
+    release.json) instead of the GitHub API. ``auth_headers`` replaces the
+    GitHub token headers (pass ``{}`` to send none).
+    """
+    from .cache import ReleaseCache, release_ttl
+
+    api_base = github_api_url()
+    if url:
+        release_cache = ReleaseCache(api_url=url)
+    else:
+        release_cache = ReleaseCache(api_url=None if api_base == DEFAULT_GITHUB_API_URL else api_base)
+    cached = None if refresh else release_cache.load(repo_owner, repo_name)
+    if cached and release_cache.is_fresh(cached, release_ttl(ttl)):
+        if verbose:
+            console.print("[cyan]Using cached release information[/cyan]")
+        return cached["data"]
+
     if client is None:
-        client = httpx.Client(verify=ssl_context)
+        client = create_http_client()
 
     if verbose:
         console.print("[cyan]Fetching latest release information...[/cyan]")
-    api_url = f"https://api.github.com/repos/{repo_owner}/{repo_name}/releases/latest"
+    api_url = url or f"{api_base}/repos/{repo_owner}/{repo_name}/releases/latest"
 
     try:
         response = client.get(
             api_url,
             timeout=30,
             follow_redirects=True,
-            headers=_github_auth_headers(github_token),
+            headers={**(_github_auth_headers(github_token) if auth_headers is None else auth_headers), **release_cache.conditional_headers(cached)},
         )
         status = response.status_code
+        if status == 304 and cached:
+            release_cache.touch(repo_owner, repo_name, cached)
+            if verbose:
+                console.print("[cyan]Release information not modified, using cache[/cyan]")
+            return cached["data"]
         if status != 200:
-            msg = f"GitHub API returned {status} for {api_url}"
-            if debug:
-                msg += f"\nResponse headers: {response.headers}\nBody (truncated 500): {response.text[:500]}"
+            msg = f"{'Release server' if url else 'GitHub API'} returned {status} for {api_url}"
             raise RuntimeError(msg)
         try:
             release_data = response.json()
         except ValueError as je:
-            raise RuntimeError(f"Failed to parse release JSON: {je}\nRaw (truncated 400): {response.text[:400]}")
+            raise RuntimeError(f"Failed to parse release JSON: {je}")
     except Exception as e:
-        console.print(f"[red]Error fetching release information[/red]")
+        if raise_errors:
+            raise
+        console.print("[red]Error fetching release information[/red]")
         console.print(Panel(str(e), title="Fetch Error", border_style="red"))
         raise typer.Exit(1)
 
-    assets = release_data.get("assets", [])
-    pattern = f"persona-kit-template-{ai_assistant}-{script_type}"
-    matching_assets = [
-        asset for asset in assets
-        if pattern in asset["name"] and asset["name"].endswith(".zip")
-    ]
+    release_cache.save(repo_owner, repo_name, release_data, response.headers.get("etag"), response.headers.get("last-modified"))
+    return release_data
 
-    asset = matching_assets[0] if matching_assets else None
 
-    if asset is None:
-        console.print(f"[red]No matching release asset found[/red] for [bold]{ai_assistant}[/bold] (expected pattern: [bold]{pattern}[/bold])")
-        asset_names = [a.get('name', '?') for a in assets]
-        console.print(Panel("\n".join(asset_names) or "(no assets)", title="Available Assets", border_style="yellow"))
-        raise typer.Exit(1)
+def prefetch_release_data(source: "TemplateSource", client: "httpx.Client", github_token: str = None, *, refresh: bool = False, ttl: Optional[int] = None) -> "Future":
+    """Start fetching the latest release metadata on a background thread.
 
-    download_url = asset["browser_download_url"]
-    filename = asset["name"]
-    file_size = asset["size"]
+    Used by ``init`` to overlap the API round trip with interactive prompts.
+    The future resolves to the release data, or None if the fetch failed;
+    the foreground fetch then retries and reports the error.
+    """
+    import threading
+    from concurrent.futures import Future
 
-    if verbose:
-        console.print(f"[cyan]Found template:[/cyan] {filename}")
-        console.print(f"[cyan]Size:[/cyan] {file_size:,} bytes")
-        console.print(f"[cyan]Release:[/cyan] {release_data['tag_name']}")
+    future = Future()
 
-    zip_path = download_dir / filename
-    if verbose:
-        console.print(f"[cyan]Downloading template...[/cyan]")
+    def fetch() -> None:
+        try:
+            future.set_result(source.release_data(client, github_token, refresh=refresh, ttl=ttl, raise_errors=True))
+        except Exception:
+            future.set_result(None)
 
-    try:
-        with client.stream(
-            "GET",
-            download_url,
-            timeout=60,
-            follow_redirects=True,
-            headers=_github_auth_headers(github_token),
-        ) as response:
-            if response.status_code != 200:
-                body_sample = response.text[:400]
-                raise RuntimeError(f"Download failed with {response.status_code}\nHeaders: {response.headers}\nBody (truncated): {body_sample}")
-            total_size = int(response.headers.get('content-length', 0))
-            with open(zip_path, 'wb') as f:
-                if total_size == 0:
-                    for chunk in response.iter_bytes(chunk_size=8192):
-                        f.write(chunk)
-                else:
-                    if show_progress:
-                        with Progress(
-                            SpinnerColumn(),
-                            TextColumn("[progress.description]{task.description}"),
-                            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-                            console=console,
-                        ) as progress:
-                            task = progress.add_task("Downloading...", total=total_size)
-                            downloaded = 0
-                            for chunk in response.iter_bytes(chunk_size=8192):
-                                f.write(chunk)
-                                downloaded += len(chunk)
-                                progress.update(task, completed=downloaded)
-                    else:
-                        for chunk in response.iter_bytes(chunk_size=8192):
-                            f.write(chunk)
-    except Exception as e:
-        console.print(f"[red]Error downloading template[/red]")
-        detail = str(e)
-        if zip_path.exists():
-            zip_path.unlink()
-        console.print(Panel(detail, title="Download Error", border_style="red"))
-        raise typer.Exit(1)
-    if verbose:
-        console.print(f"Downloaded: {filename}")
-    metadata = {
-        "filename": filename,
-        "size": file_size,
-        "release": release_data["tag_name"],
-        "asset_url": download_url
-    }
-    return zip_path, metadata
+    # Daemon thread: cancelling a prompt must not wait for the request to finish
+    threading.Thread(target=fetch, name="persona-kit-release-prefetch", daemon=True).start()
+    return future
 
-def get_release_data(repo_owner: str, repo_name: str, client: httpx.Client, github_token: str = None, verbose: bool = True) -> dict:
-    """Fetch release data from GitHub API."""
-    if client is None:
-        client = httpx.Client(verify=ssl_context)
 
-    if verbose:
-        console.print("[cyan]Fetching latest release information...[/cyan]")
-    api_url = f"https://api.github.com/repos/{repo_owner}/{repo_name}/releases/latest"
+def template_asset_pattern(ai_assistant: str, script_type: str) -> str:
+    """Return the release asset name prefix for an AI assistant and script type."""
+    return f"persona-kit-template-{ai_assistant}-{script_type}"
 
-    try:
+
+# The release also ships one package with a pkg-<agent>-<script>/ tree per combination
+COMPLETE_ASSET_PATTERN = "persona-kit-complete-"
+
+
+def agent_member_selector(primary: str, extra_agents: list, script_type: str):
+    """Return a member filter for building a multi-agent project from the complete package.
+
+    The primary agent's ``pkg-<agent>-<script>/`` tree is taken whole; for the
+    other agents only their agent folder is kept (the AGENT_CONFIG folder, or
+    the ``.<agent>/`` folder the release script builds). Use as the ``select``
+    argument of extract_template_members.
+    """
+    primary_root = f"pkg-{primary}-{script_type}" + os.path.sep
+    extra = []
+    for ai in extra_agents:
+        folders = {os.path.normpath(AGENT_CONFIG[ai]["folder"]), f".{ai}"}
+        extra.append((f"pkg-{ai}-{script_type}" + os.path.sep, folders, tuple(f + os.path.sep for f in folders)))
+
+    def select(rel_path: str) -> Optional[str]:
+        if rel_path.startswith(primary_root):
+            return rel_path[len(primary_root):] or None
+        for root, folders, prefixes in extra:
+            if rel_path.startswith(root):
+                inner = rel_path[len(root):]
+                return inner if inner in folders or inner.startswith(prefixes) else None
+        return None
+
+    return select
+
+
+def asset_sha256(asset: dict) -> Optional[str]:
+    """Return the sha256 digest GitHub publishes for a release asset, if any."""
+    digest = asset.get("digest") or ""
+    algorithm, _, value = digest.partition(":")
+    return value.lower() if algorithm == "sha256" and value else None
+
+
+# Checksum manifests (sha256sum format) published next to the release assets
+CHECKSUM_MANIFEST_NAMES = ("checksums.sha256", "SHA256SUMS")
+
+
+def parse_checksum_manifest(text: str) -> dict:
+    """Parse ``<sha256>  <filename>`` lines into a filename -> digest mapping."""
+    checksums = {}
+    for line in text.splitlines():
+        parts = line.strip().split(maxsplit=1)
+        if len(parts) == 2 and len(parts[0]) == 64:
+            checksums[parts[1].lstrip("*").strip()] = parts[0].lower()
+    return checksums
+
+
+def fetch_checksum_manifest(client: "httpx.Client", assets: list, headers: Optional[dict] = None) -> dict:
+    """Download and parse the release's checksum manifest; empty if none is published.
+
+    ``headers`` are sent with the request; pass the template source's
+    auth_headers so only the sources that want a token receive one.
+    """
+    manifest = next((a for a in assets if a.get("name") in CHECKSUM_MANIFEST_NAMES), None)
+    if manifest is None:
+        return {}
+
+    def fetch() -> str:
         response = client.get(
-            api_url,
+            manifest["browser_download_url"],
             timeout=30,
             follow_redirects=True,
-            headers=_github_auth_headers(github_token),
+            headers=headers or {},
         )
-        status = response.status_code
-        if status != 200:
-            msg = f"GitHub API returned {status} for {api_url}"
-            raise RuntimeError(msg)
-        try:
-            release_data = response.json()
-        except ValueError as je:
-            raise RuntimeError(f"Failed to parse release JSON: {je}")
-    except Exception as e:
-        console.print("[red]Error fetching release information[/red]")
-        console.print(Panel(str(e), title="Fetch Error", border_style="red"))
-        raise typer.Exit(1)
-    
-    return release_data
+        _check_download_status(response, 200)
+        return response.text
 
+    return parse_checksum_manifest(_with_retries(fetch, DOWNLOAD_RETRIES))
 
-def find_matching_asset(assets: list, ai_assistant: str, script_type: str) -> dict:
-    """Find the matching asset based on AI assistant and script type."""
-    pattern = f"persona-kit-template-{ai_assistant}-{script_type}"
+
+def select_asset(assets: list, ai_assistant: str, script_type: str, pattern: Optional[str] = None) -> Optional[dict]:
+    """Return the template asset for an AI assistant and script type (or an explicit name pattern), or None."""
+    pattern = pattern or template_asset_pattern(ai_assistant, script_type)
     matching_assets = [
         asset for asset in assets
         if pattern in asset["name"] and asset["name"].endswith(".zip")
     ]
+    return matching_assets[0] if matching_assets else None
 
-    asset = matching_assets[0] if matching_assets else None
+
+def find_matching_asset(assets: list, ai_assistant: str, script_type: str, pattern: Optional[str] = None) -> dict:
+    """Find the matching asset based on AI assistant and script type."""
+    asset = select_asset(assets, ai_assistant, script_type, pattern)
 
     if asset is None:
+        pattern = pattern or template_asset_pattern(ai_assistant, script_type)
         console.print(f"[red]No matching release asset found[/red] for [bold]{ai_assistant}[/bold] (expected pattern: [bold]{pattern}[/bold])")
         asset_names = [a.get('name', '?') for a in assets]
         console.print(Panel("\n".join(asset_names) or "(no assets)", title="Available Assets", border_style="yellow"))
@@ -635,109 +829,663 @@ def find_matching_asset(assets: list, ai_assistant: str, script_type: str) -> di
     return asset
 
 
-def download_file(client: httpx.Client, download_url: str, zip_path: Path, show_progress: bool = True, github_token: str = None) -> None:
-    """Download a file from a URL."""
+DOWNLOAD_CHUNK_SIZE = 8192
+MIN_SEGMENT_SIZE = 1024 * 1024  # don't split downloads into ranges smaller than this
+DOWNLOAD_RETRIES = 3
+DOWNLOAD_BACKOFF_BASE = 0.5  # seconds; doubled per attempt
+DOWNLOAD_BACKOFF_MAX = 8.0
+
+
+class _RetryableDownloadError(RuntimeError):
+    """A download failure worth retrying: server error, throttling or a truncated body."""
+
+
+def _with_retries(fn, retries: int, verbose: bool = False):
+    """Call ``fn`` and retry transient failures with bounded exponential backoff."""
+    import httpx
+
+    for attempt in range(retries + 1):
+        try:
+            return fn()
+        except (httpx.TransportError, _RetryableDownloadError) as e:
+            if attempt >= retries:
+                raise
+            delay = min(DOWNLOAD_BACKOFF_MAX, DOWNLOAD_BACKOFF_BASE * (2 ** attempt))
+            if verbose:
+                console.print(f"[yellow]Download interrupted ({e}); retrying in {delay:.1f}s...[/yellow]")
+            time.sleep(delay)
+
+
+def _check_download_status(response, expected: int) -> None:
+    """Raise for an unexpected status, marking server errors and throttling as retryable."""
+    if response.status_code == expected:
+        return
+    response.read()
+    body_sample = response.text[:400]
+    error = _RetryableDownloadError if response.status_code >= 500 or response.status_code == 429 else RuntimeError
+    raise error(f"Download failed with {response.status_code}\nHeaders: {response.headers}\nBody (truncated): {body_sample}")
+
+
+def _part_paths(zip_path: Path) -> Tuple[Path, Path]:
+    """Return the partial download file and its validator file for a target path."""
+    return zip_path.with_name(zip_path.name + ".part"), zip_path.with_name(zip_path.name + ".part.json")
+
+
+def _load_part_state(zip_path: Path, download_url: str) -> Optional[dict]:
+    """Return the saved validator of a resumable partial download, discarding stale partials."""
+    part_path, state_path = _part_paths(zip_path)
     try:
-        with client.stream(
-            "GET",
-            download_url,
-            timeout=60,
-            follow_redirects=True,
-            headers=_github_auth_headers(github_token),
-        ) as response:
-            if response.status_code != 200:
-                body_sample = response.text[:400]
-                raise RuntimeError(f"Download failed with {response.status_code}\nHeaders: {response.headers}\nBody (truncated): {body_sample}")
-            total_size = int(response.headers.get('content-length', 0))
-            with open(zip_path, 'wb') as f:
-                if total_size == 0:
-                    for chunk in response.iter_bytes(chunk_size=8192):
+        with open(state_path, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+        if state.get("url") == download_url and part_path.stat().st_size <= state.get("size", 0):
+            return state
+    except (OSError, ValueError):
+        pass
+    part_path.unlink(missing_ok=True)
+    state_path.unlink(missing_ok=True)
+    return None
+
+
+def _stream_download(client: "httpx.Client", download_url: str, zip_path: Path, headers: dict, show_progress: bool) -> str:
+    """Stream a file over one connection into ``<zip_path>.part``, resuming a previous partial.
+
+    The partial's validator (ETag and total size) is saved beside it so that a
+    later attempt can continue with a Range request; the part file is renamed
+    to ``zip_path`` once complete. Returns the sha256 of the file, computed
+    over the chunks as they are written (only a resumed prefix is re-read).
+    """
+    part_path, state_path = _part_paths(zip_path)
+    state = _load_part_state(zip_path, download_url)
+    offset = part_path.stat().st_size if state else 0
+    digest = hashlib.sha256()
+
+    request_headers = dict(headers)
+    if offset:
+        request_headers["Range"] = f"bytes={offset}-"
+        # Weak ETags can't be used with If-Range; the total size check below still applies
+        if state.get("etag") and not state["etag"].startswith("W/"):
+            request_headers["If-Range"] = state["etag"]
+
+    with client.stream(
+        "GET",
+        download_url,
+        timeout=60,
+        follow_redirects=True,
+        headers=request_headers,
+    ) as response:
+        if offset and response.status_code == 416 and offset == state["size"]:
+            total_size = offset
+            response.read()
+            with open(part_path, 'rb') as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                    digest.update(chunk)
+        elif offset and response.status_code == 416:
+            # The partial doesn't fit the file on the server any more; start over from byte 0
+            response.read()
+            part_path.unlink(missing_ok=True)
+            state_path.unlink(missing_ok=True)
+            raise _RetryableDownloadError(f"Server rejected resuming at byte {offset:,} (416); restarting the download")
+        else:
+            resumed = bool(offset) and response.status_code == 206
+            _check_download_status(response, 206 if resumed else 200)
+            length = int(response.headers.get('content-length', 0))
+            if resumed:
+                content_range = response.headers.get("content-range", "")
+                if not content_range.startswith(f"bytes {offset}-") or not content_range.endswith(f"/{state['size']}"):
+                    part_path.unlink(missing_ok=True)
+                    raise _RetryableDownloadError(f"Resumed download returned unexpected range: {content_range or 'none'}")
+                total_size = state["size"]
+                with open(part_path, 'rb') as f:
+                    for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                        digest.update(chunk)
+            else:
+                offset, total_size = 0, length
+                with open(state_path, 'w', encoding='utf-8') as f:
+                    json.dump({"url": download_url, "etag": response.headers.get("etag"), "size": total_size}, f)
+
+            with open(part_path, 'ab' if resumed else 'wb') as f, _download_progress(show_progress, total_size, offset) as advance:
+                for chunk in response.iter_bytes(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    f.write(chunk)
+                    digest.update(chunk)
+                    advance(len(chunk))
+
+    received = part_path.stat().st_size
+    if total_size and received != total_size:
+        raise _RetryableDownloadError(f"Connection closed after {received:,} of {total_size:,} bytes")
+    os.replace(part_path, zip_path)
+    state_path.unlink(missing_ok=True)
+    return digest.hexdigest()
+
+
+@contextlib.contextmanager
+def _download_progress(show_progress: bool, total_size: int, completed: int = 0):
+    """Yield a callback that advances a download progress bar by n bytes (no-op when hidden)."""
+    if not show_progress or total_size <= 0:
+        yield lambda n: None
+        return
+
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+        console=console,
+    ) as progress:
+        task = progress.add_task("Downloading...", total=total_size, completed=completed)
+        yield lambda n: progress.advance(task, n)
+
+
+def _probe_range_support(client: "httpx.Client", download_url: str, headers: dict) -> Optional[Tuple[str, int, dict]]:
+    """Return (final_url, size, headers) if the server serves byte ranges for the URL, else None.
+
+    Redirects are resolved once here so range requests go straight to the final
+    host; the Authorization header is only kept if that host is unchanged.
+    """
+    import httpx
+
+    try:
+        response = client.head(download_url, timeout=30, follow_redirects=True, headers=headers)
+    except httpx.HTTPError:
+        return None
+    if response.status_code != 200 or response.headers.get("accept-ranges", "").lower() != "bytes":
+        return None
+    size = int(response.headers.get("content-length", 0) or 0)
+    if size < 2 * MIN_SEGMENT_SIZE:
+        return None
+    if response.url.host != httpx.URL(download_url).host:
+        headers = {k: v for k, v in headers.items() if k.lower() != "authorization"}
+    return str(response.url), size, headers
+
+
+def _download_ranges(client: "httpx.Client", url: str, zip_path: Path, total_size: int, segments: int, headers: dict, advance, retries: int = DOWNLOAD_RETRIES) -> None:
+    """Fetch a file as concurrent byte ranges written in place into a preallocated file.
+
+    Each segment retries on its own, continuing from the last byte it wrote.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    segments = max(1, min(segments, total_size // MIN_SEGMENT_SIZE))
+    segment_size = -(-total_size // segments)
+    bounds = [(start, min(start + segment_size, total_size) - 1) for start in range(0, total_size, segment_size)]
+    part_path, _ = _part_paths(zip_path)
+
+    with open(part_path, 'wb') as f:
+        f.truncate(total_size)
+
+    def fetch(start: int, end: int) -> None:
+        position = start
+
+        def attempt() -> None:
+            nonlocal position
+            with client.stream(
+                "GET",
+                url,
+                timeout=60,
+                headers={**headers, "Range": f"bytes={position}-{end}"},
+            ) as response:
+                _check_download_status(response, 206)
+                # Each segment uses its own handle, so writes land at their own offsets
+                with open(part_path, 'r+b') as f:
+                    f.seek(position)
+                    for chunk in response.iter_bytes(chunk_size=DOWNLOAD_CHUNK_SIZE):
                         f.write(chunk)
-                else:
-                    if show_progress:
-                        with Progress(
-                            SpinnerColumn(),
-                            TextColumn("[progress.description]{task.description}"),
-                            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-                            console=console,
-                        ) as progress:
-                            task = progress.add_task("Downloading...", total=total_size)
-                            downloaded = 0
-                            for chunk in response.iter_bytes(chunk_size=8192):
-                                f.write(chunk)
-                                downloaded += len(chunk)
-                                progress.update(task, completed=downloaded)
-                    else:
-                        for chunk in response.iter_bytes(chunk_size=8192):
-                            f.write(chunk)
+                        position += len(chunk)
+                        advance(len(chunk))
+            if position != end + 1:
+                raise _RetryableDownloadError(f"Range request for bytes {start}-{end} stopped at {position}")
+
+        _with_retries(attempt, retries)
+
+    try:
+        with ThreadPoolExecutor(max_workers=len(bounds)) as pool:
+            for future in [pool.submit(fetch, start, end) for start, end in bounds]:
+                future.result()
+    except BaseException:
+        part_path.unlink(missing_ok=True)
+        raise
+    os.replace(part_path, zip_path)
+
+
+def download_file(client: "httpx.Client", download_url: str, zip_path: Path, show_progress: bool = True, github_token: str = None, segments: int = 1, retries: int = DOWNLOAD_RETRIES, auth_headers: Optional[dict] = None) -> str:
+    """Download a file from a URL.
+
+    With ``segments`` > 1 the file is split into that many HTTP Range requests
+    fetched concurrently, provided the server advertises ``Accept-Ranges: bytes``
+    and the file is big enough to split; otherwise it is streamed over a single
+    connection. Transient failures are retried up to ``retries`` times with
+    bounded exponential backoff on the same client, and an interrupted
+    single-stream download is kept as ``<zip_path>.part`` so the next attempt
+    (in this run or a later one) resumes where it stopped.
+
+    Returns the sha256 of the downloaded file. The single stream hashes chunks
+    as they arrive; ranged segments arrive out of order, so that mode hashes
+    the finished file once. ``auth_headers`` replaces the GitHub token
+    headers (pass ``{}`` to send none).
+    """
+    from .cache import sha256_file
+
+    headers = _github_auth_headers(github_token) if auth_headers is None else dict(auth_headers)
+    try:
+        ranged = _probe_range_support(client, download_url, headers) if segments > 1 else None
+        if ranged:
+            final_url, total_size, range_headers = ranged
+            with _download_progress(show_progress, total_size) as advance:
+                _download_ranges(client, final_url, zip_path, total_size, segments, range_headers, advance, retries)
+            return sha256_file(zip_path)
+
+        return _with_retries(lambda: _stream_download(client, download_url, zip_path, headers, show_progress), retries, verbose=show_progress)
     except Exception as e:
         console.print("[red]Error downloading template[/red]")
         detail = str(e)
         if zip_path.exists():
             zip_path.unlink()
+        part_path, _ = _part_paths(zip_path)
+        if part_path.exists():
+            detail += f"\n\nPartial download kept for resuming: {part_path}"
         console.print(Panel(detail, title="Download Error", border_style="red"))
         raise typer.Exit(1)
 
 
-def download_template_from_github(ai_assistant: str, download_dir: Path, *, script_type: str = "sh", verbose: bool = True, show_progress: bool = True, client: httpx.Client = None, debug: bool = False, github_token: str = None, repo_owner: str = "Nom-nom-hub", repo_name: str = "persona-kit") -> Tuple[Path, dict]:
-    """Download template from GitHub releases."""
+SPOOL_MAX_SIZE = 32 * 1024 * 1024  # archives up to this size are buffered in memory
+
+
+def download_to_spool(client: "httpx.Client", download_url: str, show_progress: bool = True, github_token: str = None, retries: int = DOWNLOAD_RETRIES, auth_headers: Optional[dict] = None) -> Tuple[BinaryIO, str]:
+    """Download a file into a SpooledTemporaryFile instead of the working directory.
+
+    The buffer stays in memory up to SPOOL_MAX_SIZE and spills to the system
+    temp dir beyond that; it disappears when closed, even after a crash.
+    Retries resume from the buffered length with a Range request. Returns the
+    buffer (rewound) and the sha256 computed while streaming.
+    ``auth_headers`` replaces the GitHub token headers (pass ``{}`` to send none).
+    """
+    spool = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE)
+    state = {"digest": hashlib.sha256(), "etag": None, "size": 0}
+
+    def attempt() -> None:
+        offset = spool.tell()
+        headers = _github_auth_headers(github_token) if auth_headers is None else dict(auth_headers)
+        if offset:
+            headers["Range"] = f"bytes={offset}-"
+            if state["etag"] and not state["etag"].startswith("W/"):
+                headers["If-Range"] = state["etag"]
+
+        with client.stream("GET", download_url, timeout=60, follow_redirects=True, headers=headers) as response:
+            if offset and response.status_code == 206:
+                content_range = response.headers.get("content-range", "")
+                if not content_range.startswith(f"bytes {offset}-"):
+                    spool.seek(0)
+                    spool.truncate()
+                    raise _RetryableDownloadError(f"Resumed download returned unexpected range: {content_range or 'none'}")
+            else:
+                # Fresh download, or the server ignored the Range/If-Range and sent everything
+                _check_download_status(response, 200)
+                spool.seek(0)
+                spool.truncate()
+                state.update(digest=hashlib.sha256(), etag=response.headers.get("etag"), size=int(response.headers.get('content-length', 0)))
+
+            with _download_progress(show_progress, state["size"], spool.tell()) as advance:
+                for chunk in response.iter_bytes(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    spool.write(chunk)
+                    state["digest"].update(chunk)
+                    advance(len(chunk))
+
+        if state["size"] and spool.tell() != state["size"]:
+            raise _RetryableDownloadError(f"Connection closed after {spool.tell():,} of {state['size']:,} bytes")
+
+    try:
+        _with_retries(attempt, retries, verbose=show_progress)
+    except Exception as e:
+        spool.close()
+        console.print("[red]Error downloading template[/red]")
+        console.print(Panel(str(e), title="Download Error", border_style="red"))
+        raise typer.Exit(1)
+
+    spool.seek(0)
+    return spool, state["digest"].hexdigest()
+
+
+def download_template_from_github(ai_assistant: str, download_dir: Optional[Path] = None, *, script_type: str = "sh", verbose: bool = True, show_progress: bool = True, client: "httpx.Client" = None, debug: bool = False, github_token: str = None, repo_owner: str = "Nom-nom-hub", repo_name: str = "persona-kit", offline: bool = False, use_cache: bool = True, refresh: bool = False, release_ttl: Optional[int] = None, download_segments: int = 1, release_data: Optional[dict] = None, asset_pattern: Optional[str] = None, auth_headers: Optional[dict] = None) -> Tuple[Union[Path, BinaryIO], dict]:
+    """Download template from GitHub releases, reusing the local template cache.
+
+    When the archive lives in the cache (``metadata["cached"]``) the cached
+    file itself is returned and callers must not delete it;
+    ``metadata["cache_hit"]`` tells whether the network download was skipped.
+    Without a cache, the archive is written to ``download_dir`` if given and
+    otherwise returned as an in-memory spooled file the caller must close. With ``offline`` the newest cached template for
+    the assistant/script combination is used and no network request is made.
+    Pass ``release_data`` to reuse release metadata that was already fetched
+    and ``asset_pattern`` to pick an asset other than the agent/script
+    template (e.g. COMPLETE_ASSET_PATTERN). ``auth_headers`` is sent with
+    every request instead of the GitHub token headers (``{}`` for mirrors).
+    """
+    from .cache import TemplateCache
+
+    cache = TemplateCache() if (use_cache or offline) else None
+
+    if offline:
+        pattern = asset_pattern or template_asset_pattern(ai_assistant, script_type)
+        entry = cache.find_latest(pattern)
+        if entry is None:
+            console.print(f"[red]No cached template found[/red] for [bold]{ai_assistant}[/bold] (expected pattern: [bold]{pattern}[/bold])")
+            console.print("Run [cyan]persona-kit init[/cyan] once without [cyan]--offline[/cyan] to populate the cache.")
+            raise typer.Exit(1)
+        if verbose:
+            console.print(f"[cyan]Using cached template:[/cyan] {entry['asset_name']} ({entry['tag_name']})")
+        return entry["path"], {
+            "filename": entry["asset_name"],
+            "size": entry["size"],
+            "release": entry["tag_name"],
+            "asset_url": None,
+            "sha256": entry["sha256"],
+            "verified": False,
+            "cached": True,
+            "cache_hit": True,
+        }
+
     # Get release data
-    release_data = get_release_data(repo_owner, repo_name, client, github_token, verbose)
-    
+    if release_data is None:
+        release_data = get_release_data(repo_owner, repo_name, client, github_token, verbose, refresh=refresh, ttl=release_ttl, auth_headers=auth_headers)
+
     # Find matching asset
     assets = release_data.get("assets", [])
-    asset = find_matching_asset(assets, ai_assistant, script_type)
+    asset = find_matching_asset(assets, ai_assistant, script_type, asset_pattern)
     
     # Prepare download
     download_url = asset["browser_download_url"]
     filename = asset["name"]
     file_size = asset["size"]
+    tag_name = release_data["tag_name"]
 
     if verbose:
         console.print(f"[cyan]Found template:[/cyan] {filename}")
         console.print(f"[cyan]Size:[/cyan] {file_size:,} bytes")
-        console.print(f"[cyan]Release:[/cyan] {release_data['tag_name']}")
+        console.print(f"[cyan]Release:[/cyan] {tag_name}")
+
+    metadata = {
+        "filename": filename,
+        "size": file_size,
+        "release": tag_name,
+        "asset_url": download_url,
+        "sha256": asset_sha256(asset),
+        "verified": False,
+        "cached": False,
+        "cache_hit": False,
+    }
+
+    entry = cache.lookup(tag_name, filename, metadata["sha256"]) if cache else None
+    if entry:
+        if verbose:
+            console.print(f"[cyan]Using cached template:[/cyan] {entry['path']}")
+        # Entries were hashed when stored, so a hit is trusted without rehashing
+        metadata.update(sha256=entry["sha256"], verified=bool(metadata["sha256"]), cached=True, cache_hit=True)
+        return entry["path"], metadata
+
+    # Download next to the cache so partials survive for resuming and storing is a
+    # rename. Without a usable cache (or explicit download_dir) buffer in memory.
+    if cache:
+        try:
+            (cache.downloads_dir / tag_name).mkdir(parents=True, exist_ok=True)
+            download_dir = cache.downloads_dir / tag_name
+        except OSError:
+            cache = None
+    if client is None:
+        client = create_http_client()
+
+    # Prefer the digest from the release metadata; fall back to the published manifest
+    expected_sha256 = metadata["sha256"]
+    if expected_sha256 is None:
+        try:
+            expected_sha256 = fetch_checksum_manifest(client, assets, _github_auth_headers(github_token) if auth_headers is None else auth_headers).get(filename)
+        except Exception as e:
+            console.print("[red]Error fetching checksum manifest[/red]")
+            console.print(Panel(str(e), title="Fetch Error", border_style="red"))
+            raise typer.Exit(1)
 
-    zip_path = download_dir / filename
     if verbose:
         console.print(f"[cyan]Downloading template...[/cyan]")
 
     # Perform download
-    download_file(client, download_url, zip_path, show_progress, github_token)
+    if download_dir is None:
+        archive, actual_sha256 = download_to_spool(client, download_url, show_progress, github_token, auth_headers=auth_headers)
+    else:
+        archive = download_dir / filename
+        actual_sha256 = download_file(client, download_url, archive, show_progress, github_token, segments=download_segments, auth_headers=auth_headers)
+
+    if expected_sha256 and actual_sha256 != expected_sha256:
+        if isinstance(archive, Path):
+            archive.unlink(missing_ok=True)
+        else:
+            archive.close()
+        console.print("[red]Template checksum mismatch[/red]")
+        console.print(Panel(
+            f"{filename}\nexpected sha256: {expected_sha256}\nactual sha256:   {actual_sha256}\n\n"
+            "The archive was discarded and will not be extracted.",
+            title="Integrity Error",
+            border_style="red",
+        ))
+        raise typer.Exit(1)
+    metadata.update(sha256=actual_sha256, verified=bool(expected_sha256))
     
     if verbose:
-        console.print(f"Downloaded: {filename}")
-        
-    metadata = {
-        "filename": filename,
-        "size": file_size,
-        "release": release_data["tag_name"],
-        "asset_url": download_url
-    }
-    return zip_path, metadata
+        console.print(f"Downloaded: {filename}" + (" (sha256 verified)" if expected_sha256 else ""))
+
+    if cache:
+        try:
+            entry = cache.store(tag_name, filename, archive, sha256=actual_sha256)
+        except OSError as e:
+            # An unwritable cache must never break init; keep the plain download
+            if verbose:
+                console.print(f"[yellow]Warning: Could not cache template:[/yellow] {e}")
+        else:
+            metadata.update(sha256=entry["sha256"], cached=True)
+            archive = entry["path"]
 
+    return archive, metadata
+
+
+def _member_relpath(name: str) -> str:
+    """Sanitize an archive member name the way ZipFile.extract does (no drives, '..' or '.')."""
+    arcname = os.path.splitdrive(name.replace('/', os.path.sep))[1]
+    invalid_path_parts = ('', os.path.curdir, os.path.pardir)
+    return os.path.sep.join(part for part in arcname.split(os.path.sep) if part not in invalid_path_parts)
+
+
+def _archive_root_prefix(members: list) -> str:
+    """Return the single top-level directory all members live under (e.g. 'repo-main/'), or ''."""
+    names = [m.filename for m in members if m.filename.strip("/")]
+    tops = {name.split("/", 1)[0] for name in names}
+    if len(tops) != 1:
+        return ""
+    prefix = tops.pop() + "/"
+    return prefix if all(name.startswith(prefix) for name in names) else ""
+
+
+SCRIPTS_REL_PATH = os.path.join(".persona-kit", "scripts") + os.path.sep
+
+
+def _with_exec_bits(mode: int) -> int:
+    """Add execute bits wherever read bits are set (owner always executable)."""
+    new_mode = mode
+    if mode & 0o400: new_mode |= 0o100
+    if mode & 0o040: new_mode |= 0o010
+    if mode & 0o004: new_mode |= 0o001
+    if not (new_mode & 0o100):
+        new_mode |= 0o100
+    return new_mode
 
-def download_and_extract_template(project_path: Path, ai_assistant: str, script_type: str, is_current_dir: bool = False, *, verbose: bool = True, tracker: StepTracker | None = None, client: httpx.Client = None, debug: bool = False, github_token: str = None) -> Path:
-    """Download the latest release and extract it to create a new project."""
-    current_dir = Path.cwd()
+
+def _member_wants_exec(info: zipfile.ZipInfo, rel_path: str, head: bytes) -> bool:
+    """Return True if an extracted member should be executable (POSIX only).
+
+    Either the archive was built on Unix and recorded execute bits in the
+    member's external_attr, or it is a .sh script under .persona-kit/scripts
+    whose first bytes (already read during extraction) are a shebang.
+    """
+    if os.name == "nt":
+        return False
+    if info.create_system == 3 and (info.external_attr >> 16) & 0o111:
+        return True
+    return rel_path.startswith(SCRIPTS_REL_PATH) and rel_path.endswith(".sh") and head[:2] == b"#!"
+
+
+def _file_matches_member(path: Path, info: zipfile.ZipInfo, digest=None) -> bool:
+    """Return True if an existing file has the member's size and CRC32.
+
+    Both come from the archive's central directory; the file's CRC is only
+    computed (streaming) when the sizes already match. ``digest`` (a
+    hashlib object) is fed the same chunks.
+    """
+    try:
+        if not path.is_file() or path.stat().st_size != info.file_size:
+            return False
+        crc = 0
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                crc = zlib.crc32(chunk, crc)
+                if digest is not None:
+                    digest.update(chunk)
+        return crc == info.CRC
+    except OSError:
+        return False
+
+
+def extract_template_members(zip_ref: zipfile.ZipFile, dest: Path, on_decision=None, select=None) -> dict:
+    """Write every archive member straight to its final path under ``dest`` in one pass.
+
+    A single top-level directory wrapping the whole archive is stripped on the
+    fly, so nothing is extracted to a temporary location first. Each member's
+    merge decision is recorded: ``create`` for new paths, ``overwrite`` for
+    existing files, ``unchanged`` for existing files identical to the member
+    (left untouched, keeping their mtime) and ``merge`` for existing
+    directories; ``on_decision`` is called with (relative path, decision) as
+    members are processed. Execute bits are applied as each file is written
+    (see _member_wants_exec), so no separate permissions pass is needed.
+    Files are written beside their target and renamed over it, so a project
+    file hardlinked to the template cache is replaced, not written through.
+    ``select`` maps a member's relative path to its destination path, or to
+    None to skip the member without reading it.
+    Returns a summary with the file count, top-level names, per-member
+    decisions, decision counts, the bytes not rewritten, the number of
+    files made executable and each file's sha256 (``digests``, keyed by
+    "/"-separated relative path, for the install manifest).
+    """
+    from .cache import _open_replacing
+
+    members = zip_ref.infolist()
+    prefix = _archive_root_prefix(members)
+    top_level = []
+    decisions = []
+    counts = {"create": 0, "overwrite": 0, "unchanged": 0, "merge": 0}
+    files = 0
+    bytes_skipped = 0
+    executables = 0
+    digests = {}
+
+    for info in members:
+        rel_path = _member_relpath(info.filename[len(prefix):])
+        if rel_path and select is not None:
+            rel_path = select(rel_path)
+        if not rel_path:
+            continue
+        top = rel_path.split(os.path.sep, 1)[0]
+        if top not in top_level:
+            top_level.append(top)
+
+        target = dest / rel_path
+        exists = target.exists()
+        digest = hashlib.sha256()
+        if info.is_dir():
+            decision = "merge" if exists else "create"
+            target.mkdir(parents=True, exist_ok=True)
+        elif exists and _file_matches_member(target, info, digest):
+            decision = "unchanged"
+            bytes_skipped += info.file_size
+            files += 1
+            mode = target.stat().st_mode
+            if not mode & 0o111 and os.name != "nt":
+                with open(target, 'rb') as f:
+                    head = f.read(2)
+                if _member_wants_exec(info, rel_path, head):
+                    os.chmod(target, _with_exec_bits(mode))
+                    executables += 1
+        else:
+            decision = "overwrite" if exists else "create"
+            target.parent.mkdir(parents=True, exist_ok=True)
+            with zip_ref.open(info) as src, _open_replacing(target) as dst:
+                head = src.read(1024 * 1024)
+                digest.update(head)
+                dst.write(head)
+                for chunk in iter(lambda: src.read(1024 * 1024), b""):
+                    digest.update(chunk)
+                    dst.write(chunk)
+                if _member_wants_exec(info, rel_path, head):
+                    mode = os.fstat(dst.fileno()).st_mode
+                    if not mode & 0o111:
+                        os.fchmod(dst.fileno(), _with_exec_bits(mode))
+                    executables += 1
+            files += 1
+
+        if not info.is_dir():
+            digests[rel_path.replace(os.sep, "/")] = digest.hexdigest()
+        decisions.append((rel_path, decision))
+        # Counts are per file, plus existing directories merged into
+        if not info.is_dir() or decision == "merge":
+            counts[decision] += 1
+        if on_decision:
+            on_decision(rel_path, decision)
+
+    return {"files": files, "top_level": top_level, "flattened": bool(prefix), "decisions": decisions, "counts": counts, "bytes_skipped": bytes_skipped, "executables": executables, "digests": digests}
+
+
+def download_and_extract_template(project_path: Path, ai_assistant: str, script_type: str, is_current_dir: bool = False, *, verbose: bool = True, tracker: StepTracker | None = None, client: "httpx.Client" = None, debug: bool = False, github_token: str = None, offline: bool = False, use_cache: bool = True, refresh: bool = False, release_ttl: Optional[int] = None, download_segments: int = 1, materialize: str = "extract", release_data: Optional[dict] = None, extra_agents: Tuple[str, ...] = (), source: Optional["TemplateSource"] = None) -> Path:
+    """Download the latest release and extract it to create a new project.
+
+    Nothing is written to the working directory: the archive comes from the
+    template cache or an in-memory buffer and members are extracted straight
+    to their final location. With ``materialize`` set to reflink, hardlink or
+    copy, new projects from a cached archive are built from an extracted
+    cache tree instead (see cache.materialize_tree). With ``extra_agents``
+    the release's complete package is used instead of the per-agent
+    template, and those agents' folders are extracted alongside the primary
+    agent's template in the same pass. ``source`` defaults to the one
+    selected by PERSONA_KIT_TEMPLATE_SOURCE (GitHub unless set).
+    """
+    if source is None:
+        from .sources import resolve_template_source
+        source = resolve_template_source()
 
     if tracker:
-        tracker.start("fetch", "contacting GitHub API")
+        if not source.remote:
+            tracker.start("fetch", f"reading {source.describe()}")
+        else:
+            tracker.start("fetch", "reading template cache" if offline else f"contacting {source.describe()}")
     try:
-        zip_path, meta = download_template_from_github(
+        archive, meta = source.fetch(
             ai_assistant,
-            current_dir,
-            script_type=script_type,
+            script_type,
             verbose=verbose and tracker is None,
             show_progress=(tracker is None),
             client=client,
             debug=debug,
-            github_token=github_token
+            github_token=github_token,
+            offline=offline,
+            use_cache=use_cache,
+            refresh=refresh,
+            release_ttl=release_ttl,
+            download_segments=download_segments,
+            release_data=release_data,
+            asset_pattern=COMPLETE_ASSET_PATTERN if extra_agents else None,
         )
         if tracker:
-            tracker.complete("fetch", f"release {meta['release']} ({meta['size']:,} bytes)")
+            tracker.complete("fetch", f"release {meta['release']}" + (f" ({meta['size']:,} bytes)" if meta["size"] is not None else ""))
             tracker.add("download", "Download template")
-            tracker.complete("download", meta['filename'])
+            if meta.get("local"):
+                tracker.skip("download", f"{meta['filename']} (local)")
+            elif meta["cache_hit"]:
+                tracker.complete("download", f"{meta['filename']} (cached)")
+            else:
+                tracker.complete("download", f"{meta['filename']} (sha256 verified)" if meta["verified"] else meta['filename'])
     except Exception as e:
         if tracker:
             tracker.error("fetch", str(e))
@@ -746,91 +1494,152 @@ def download_and_extract_template(project_path: Path, ai_assistant: str, script_
                 console.print(f"[red]Error downloading template:[/red] {e}")
         raise
 
+    try:
+        select = agent_member_selector(ai_assistant, list(extra_agents), script_type) if extra_agents else None
+        install = {"ai": ai_assistant, "script": script_type, "agents": [ai_assistant, *extra_agents]}
+        extract_template_archive(archive, meta, project_path, is_current_dir, verbose=verbose, tracker=tracker, debug=debug, materialize=materialize, select=select, install=install)
+    finally:
+        if tracker:
+            tracker.add("cleanup", "Remove temporary archive")
+
+        if meta["cached"] or meta.get("local"):
+            # The archive lives in the template cache (or is the user's own) and is kept
+            if tracker:
+                tracker.skip("cleanup", "local template kept" if meta.get("local") else "archive kept in template cache")
+        elif isinstance(archive, Path):
+            if archive.exists():
+                archive.unlink()
+                if tracker:
+                    tracker.complete("cleanup")
+                elif verbose:
+                    console.print(f"Cleaned up: {archive.name}")
+        else:
+            archive.close()
+            if tracker:
+                tracker.complete("cleanup", "in-memory archive released")
+
+    return project_path
+
+def extract_template_archive(archive: Union[Path, BinaryIO], meta: dict, project_path: Path, is_current_dir: bool = False, *, verbose: bool = True, tracker: StepTracker | None = None, debug: bool = False, materialize: str = "extract", select=None, install: Optional[dict] = None) -> dict:
+    """Extract a fetched template archive (see download_template_from_github) into ``project_path``.
+
+    New projects are staged in a sibling directory and renamed into place.
+    ``select`` filters and remaps members (see extract_template_members).
+    With ``install`` (ai, script and agents), the installed files are
+    recorded in the project's install manifest for ``persona-kit upgrade``.
+    The archive is left alone, so one download can seed several projects.
+    Returns the extraction summary.
+    """
     if tracker:
         tracker.add("extract", "Extract template")
         tracker.start("extract")
     elif verbose:
         console.print("Extracting template...")
 
+    # New projects are built in a hidden sibling directory and renamed into
+    # place, so a half-extracted project is never visible at project_path
+    target = project_path
+    if not is_current_dir:
+        target = project_path.parent / f".{project_path.name}.persona-kit-staging-{os.getpid()}"
+        shutil.rmtree(target, ignore_errors=True)
+
     try:
         if not is_current_dir:
-            project_path.mkdir(parents=True)
+            target.mkdir(parents=True)
+
+        # Materializing only pays off for cached archives; --here keeps the merging extractor.
+        # Unpacked template directories are always materialized (copying by default).
+        from_dir = isinstance(archive, Path) and archive.is_dir()
+        chmod_failures: list[str] = []
+        use_tree = from_dir or (materialize != "extract" and select is None and not is_current_dir and meta["cached"] and isinstance(archive, Path))
+        if use_tree:
+            from .cache import TemplateCache, materialize_tree
 
-        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-            zip_contents = zip_ref.namelist()
             if tracker:
                 tracker.start("zip-list")
-                tracker.complete("zip-list", f"{len(zip_contents)} entries")
+            tree = archive if from_dir else TemplateCache().ensure_tree(meta["sha256"], archive, extract_template_members)
+            if tracker:
+                tracker.complete("zip-list", "template directory" if from_dir else "extracted cache tree")
             elif verbose:
-                console.print(f"[cyan]ZIP contains {len(zip_contents)} items[/cyan]")
-
-            if is_current_dir:
-                with tempfile.TemporaryDirectory() as temp_dir:
-                    temp_path = Path(temp_dir)
-                    zip_ref.extractall(temp_path)
-
-                    extracted_items = list(temp_path.iterdir())
-                    if tracker:
-                        tracker.start("extracted-summary")
-                        tracker.complete("extracted-summary", f"temp {len(extracted_items)} items")
-                    elif verbose:
-                        console.print(f"[cyan]Extracted {len(extracted_items)} items to temp location[/cyan]")
-
-                    source_dir = temp_path
-                    if len(extracted_items) == 1 and extracted_items[0].is_dir():
-                        source_dir = extracted_items[0]
-                        if tracker:
-                            tracker.add("flatten", "Flatten nested directory")
-                            tracker.complete("flatten")
-                        elif verbose:
-                            console.print(f"[cyan]Found nested directory structure[/cyan]")
-
-                    for item in source_dir.iterdir():
-                        dest_path = project_path / item.name
-                        if item.is_dir():
-                            if dest_path.exists():
-                                if verbose and not tracker:
-                                    console.print(f"[yellow]Merging directory:[/yellow] {item.name}")
-                                for sub_item in item.rglob('*'):
-                                    if sub_item.is_file():
-                                        rel_path = sub_item.relative_to(item)
-                                        dest_file = dest_path / rel_path
-                                        dest_file.parent.mkdir(parents=True, exist_ok=True)
-                                        shutil.copy2(sub_item, dest_file)
-                            else:
-                                shutil.copytree(item, dest_path)
-                        else:
-                            if dest_path.exists() and verbose and not tracker:
-                                console.print(f"[yellow]Overwriting file:[/yellow] {item.name}")
-                            shutil.copy2(item, dest_path)
-                    if verbose and not tracker:
-                        console.print(f"[cyan]Template files merged into current directory[/cyan]")
-            else:
-                zip_ref.extractall(project_path)
-
-                extracted_items = list(project_path.iterdir())
+                console.print(f"[cyan]Using {'template directory' if from_dir else 'extracted cache tree'} {tree}[/cyan]")
+
+            summary = materialize_tree(tree, target, "copy" if materialize == "extract" else materialize)
+            # Cached trees keep their file digests beside them; template directories are read when recording
+            summary["digests"] = None if from_dir else TemplateCache().tree_digests(meta["sha256"])
+            updated, chmod_failures = ensure_executable_scripts(target)
+            summary["executables"] += updated
+            counts = summary["counts"]
+            detail = f"{summary['files']} files ({counts['reflink']} reflinked, {counts['hardlink']} hardlinked, {counts['copy']} copied)"
+            if tracker:
+                tracker.start("extracted-summary")
+                tracker.complete("extracted-summary", detail)
+            elif verbose:
+                console.print(f"[cyan]Materialized {detail} to {project_path}:[/cyan]")
+                for name in summary["top_level"]:
+                    console.print(f"  - {name} ({'dir' if (target / name).is_dir() else 'file'})")
+        else:
+            with zipfile.ZipFile(archive, 'r') as zip_ref:
+                zip_contents = zip_ref.namelist()
                 if tracker:
-                    tracker.start("extracted-summary")
-                    tracker.complete("extracted-summary", f"{len(extracted_items)} top-level items")
+                    tracker.start("zip-list")
+                    tracker.complete("zip-list", f"{len(zip_contents)} entries")
                 elif verbose:
-                    console.print(f"[cyan]Extracted {len(extracted_items)} items to {project_path}:[/cyan]")
-                    for item in extracted_items:
-                        console.print(f"  - {item.name} ({'dir' if item.is_dir() else 'file'})")
+                    console.print(f"[cyan]ZIP contains {len(zip_contents)} items[/cyan]")
 
-                if len(extracted_items) == 1 and extracted_items[0].is_dir():
-                    nested_dir = extracted_items[0]
-                    temp_move_dir = project_path.parent / f"{project_path.name}_temp"
+                def report_decision(rel_path: str, decision: str) -> None:
+                    if decision == "overwrite":
+                        console.print(f"[yellow]Overwriting file:[/yellow] {rel_path}")
+                    elif decision == "merge":
+                        console.print(f"[yellow]Merging directory:[/yellow] {rel_path}")
 
-                    shutil.move(str(nested_dir), str(temp_move_dir))
+                summary = extract_template_members(zip_ref, target, report_decision if (is_current_dir and verbose and not tracker) else None, select)
 
-                    project_path.rmdir()
+            if tracker:
+                tracker.start("extracted-summary")
+                if is_current_dir:
+                    counts = summary["counts"]
+                    tracker.complete("extracted-summary", f"{summary['files']} files: {counts['create']} new, {counts['overwrite']} overwritten, {counts['unchanged']} unchanged ({summary['bytes_skipped']:,} bytes skipped), {counts['merge']} dirs merged")
+                else:
+                    tracker.complete("extracted-summary", f"{summary['files']} files, {len(summary['top_level'])} top-level items")
+            elif verbose:
+                console.print(f"[cyan]Extracted {summary['files']} files to {project_path}:[/cyan]")
+                for name in summary["top_level"]:
+                    console.print(f"  - {name} ({'dir' if (target / name).is_dir() else 'file'})")
 
-                    shutil.move(str(temp_move_dir), str(project_path))
-                    if tracker:
-                        tracker.add("flatten", "Flatten nested directory")
-                        tracker.complete("flatten")
-                    elif verbose:
-                        console.print(f"[cyan]Flattened nested directory structure[/cyan]")
+        if summary["flattened"]:
+            if tracker:
+                tracker.add("flatten", "Flatten nested directory")
+                tracker.complete("flatten")
+            elif verbose:
+                console.print(f"[cyan]Flattened nested directory structure[/cyan]")
+
+        if tracker:
+            tracker.add("chmod", "Set script permissions")
+            if os.name == "nt":
+                tracker.skip("chmod", "not needed on Windows")
+            elif chmod_failures:
+                tracker.error("chmod", f"{summary['executables']} set, {len(chmod_failures)} failed")
+            else:
+                tracker.complete("chmod", f"{summary['executables']} set during extraction")
+        elif verbose and summary["executables"]:
+            console.print(f"[cyan]Set execute permissions on {summary['executables']} file(s) during extraction[/cyan]")
+        if chmod_failures and verbose and not tracker:
+            console.print("[yellow]Some scripts could not be updated:[/yellow]")
+            for failure in chmod_failures:
+                console.print(f"  - {failure}")
+
+        if is_current_dir and verbose and not tracker and not use_tree:
+            counts = summary["counts"]
+            console.print(f"[cyan]Template files merged into current directory[/cyan] ({counts['create']} new, {counts['overwrite']} overwritten, {counts['unchanged']} unchanged, {counts['merge']} directories merged)")
+            if summary["bytes_skipped"]:
+                console.print(f"[cyan]Skipped rewriting {summary['bytes_skipped']:,} bytes of unchanged files[/cyan]")
+
+        if install is not None:
+            from .upgrade import write_install_manifest
+            write_install_manifest(target, archive, meta, install, select, summary["digests"])
+
+        if not is_current_dir:
+            os.rename(target, project_path)
 
     except Exception as e:
         if tracker:
@@ -841,32 +1650,27 @@ def download_and_extract_template(project_path: Path, ai_assistant: str, script_
                 if debug:
                     console.print(Panel(str(e), title="Extraction Error", border_style="red"))
 
-        if not is_current_dir and project_path.exists():
-            shutil.rmtree(project_path)
+        if not is_current_dir:
+            shutil.rmtree(target, ignore_errors=True)
         raise typer.Exit(1)
     else:
         if tracker:
             tracker.complete("extract")
-    finally:
-        if tracker:
-            tracker.add("cleanup", "Remove temporary archive")
+    return summary
 
-        if zip_path.exists():
-            zip_path.unlink()
-            if tracker:
-                tracker.complete("cleanup")
-            elif verbose:
-                console.print(f"Cleaned up: {zip_path.name}")
+def ensure_executable_scripts(project_path: Path) -> Tuple[int, list[str]]:
+    """Ensure POSIX .sh scripts under .persona-kit/scripts (recursively) have execute bits (no-op on Windows).
 
-    return project_path
-
-def ensure_executable_scripts(project_path: Path, tracker: StepTracker | None = None) -> None:
-    """Ensure POSIX .sh scripts under .persona-kit/scripts (recursively) have execute bits (no-op on Windows)."""
+    Templates extracted by extract_template_members already get their
+    permissions at extraction time; this walk is the pass for trees
+    materialized any other way (see extract_template_archive). Returns the
+    number of scripts updated and a message per script that failed.
+    """
     if os.name == "nt":
-        return  # Windows: skip silently
+        return 0, []  # Windows: skip silently
     scripts_root = project_path / ".persona-kit" / "scripts"
     if not scripts_root.is_dir():
-        return
+        return 0, []
     failures: list[str] = []
     updated = 0
     for script in scripts_root.rglob("*.sh"):
@@ -882,58 +1686,16 @@ def ensure_executable_scripts(project_path: Path, tracker: StepTracker | None =
             st = script.stat(); mode = st.st_mode
             if mode & 0o111:
                 continue
-            new_mode = mode
-            if mode & 0o400: new_mode |= 0o100
-            if mode & 0o040: new_mode |= 0o010
-            if mode & 0o004: new_mode |= 0o001
-            if not (new_mode & 0o100):
-                new_mode |= 0o100
-            os.chmod(script, new_mode)
+            os.chmod(script, _with_exec_bits(mode))
             updated += 1
         except Exception as e:
             failures.append(f"{script.relative_to(scripts_root)}: {e}")
-    if tracker:
-        detail = f"{updated} updated" + (f", {len(failures)} failed" if failures else "")
-        tracker.add("chmod", "Set script permissions recursively")
-        (tracker.error if failures else tracker.complete)("chmod", detail)
-    else:
-        if updated:
-            console.print(f"[cyan]Updated execute permissions on {updated} script(s) recursively[/cyan]")
-        if failures:
-            console.print("[yellow]Some scripts could not be updated:[/yellow]")
-            for f in failures:
-                console.print(f"  - {f}")
-
-# Placeholder command modules - to be implemented
-def constitution_command():
-    """Handle /persona-kit.constitution workflow."""
-    console.print("[cyan]Constitution command placeholder[/cyan]")
-    console.print("This will handle project constitution setup.")
-
-def personas_command():
-    """Handle /persona-kit.personas workflow."""
-    console.print("[cyan]Personas command placeholder[/cyan]")
-    console.print("This will handle persona management.")
-
-def patterns_command():
-    """Handle /persona-kit.patterns workflow."""
-    console.print("[cyan]Patterns command placeholder[/cyan]")
-    console.print("This will handle pattern management.")
-
-def workflows_command():
-    """Handle /persona-kit.workflows workflow."""
-    console.print("[cyan]Workflows command placeholder[/cyan]")
-    console.print("This will handle workflow management.")
-
-def implement_command():
-    """Handle /persona-kit.implement workflow."""
-    console.print("[cyan]Implement command placeholder[/cyan]")
-    console.print("This will handle implementation execution.")
+    return updated, failures
 
 @app.command()
 def init(
     project_name: str = typer.Argument(None, help="Name for your new project directory (optional if using --here, or use '.' for current directory)"),
-    ai_assistant: str = typer.Option(None, "--ai", help="AI assistant to use: claude, gemini, copilot, cursor-agent, qwen, opencode, codex, windsurf, kilocode, auggie, codebuddy, or q"),
+    ai_assistant: str = typer.Option(None, "--ai", help="AI assistant to use: claude, gemini, copilot, cursor-agent, qwen, opencode, codex, windsurf, kilocode, auggie, codebuddy, or q (comma-separate several, e.g. claude,gemini)"),
     script_type: str = typer.Option(None, "--script", help="Script type to use: sh or ps"),
     ignore_agent_tools: bool = typer.Option(False, "--ignore-agent-tools", help="Skip checks for AI agent tools like Claude Code"),
     no_git: bool = typer.Option(False, "--no-git", help="Skip git repository initialization"),
@@ -942,6 +1704,13 @@ def init(
     skip_tls: bool = typer.Option(False, "--skip-tls", help="Skip SSL/TLS verification (not recommended)"),
     debug: bool = typer.Option(False, "--debug", help="Show verbose diagnostic output for network and extraction failures"),
     github_token: str = typer.Option(None, "--github-token", help="GitHub token to use for API requests (or set GH_TOKEN or GITHUB_TOKEN environment variable)"),
+    offline: bool = typer.Option(False, "--offline", help="Use the newest cached template instead of contacting GitHub"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Don't read or write the template cache; download into memory"),
+    refresh: bool = typer.Option(False, "--refresh", help="Ignore cached release information and query GitHub again"),
+    release_ttl: int = typer.Option(None, "--release-ttl", help="Seconds to reuse cached release information without revalidating (default 300, or PERSONA_KIT_RELEASE_TTL)"),
+    download_segments: int = typer.Option(1, "--download-segments", min=1, help="Download the template as N concurrent HTTP range requests when the server supports it"),
+    materialize: str = typer.Option("extract", "--materialize", envvar="PERSONA_KIT_MATERIALIZE", help="How to create new projects from a cached template: extract, reflink, hardlink (shares files with the cache) or copy"),
+    template_source: str = typer.Option(None, "--template-source", help="Where templates come from: github (default), github:owner/repo, an http(s) mirror URL, a template zip or an unpacked template directory (or set PERSONA_KIT_TEMPLATE_SOURCE)"),
 ):
     """
     Initialize a new Persona Kit project from the latest template.
@@ -954,6 +1723,8 @@ def init(
     5. Initialize a fresh git repository (if not --no-git and no existing repo)
     6. Optionally set up AI assistant commands
     """
+    from rich.live import Live
+
     show_banner()
 
     if project_name == ".":
@@ -964,10 +1735,24 @@ def init(
         console.print("[red]Error:[/red] Cannot specify both project name and --here flag")
         raise typer.Exit(1)
 
+    from .cache import MATERIALIZE_MODES
+    if materialize not in MATERIALIZE_MODES:
+        console.print(f"[red]Error:[/red] Invalid materialize mode '{materialize}'. Choose from: {', '.join(MATERIALIZE_MODES)}")
+        raise typer.Exit(1)
+
     if not here and not project_name:
         console.print("[red]Error:[/red] Must specify either a project name, use '.' for current directory, or use --here flag")
         raise typer.Exit(1)
 
+    from .sources import load_template_source
+    source = load_template_source(template_source)
+
+    # Fetch release metadata while the prompts below wait for the user
+    use_network = source.remote and not offline
+    stats = ConnectionStats() if debug and use_network else None
+    local_client = create_http_client(verify=not skip_tls, max_connections=download_segments + 2, stats=stats) if use_network else None
+    prefetch = prefetch_release_data(source, local_client, github_token, refresh=refresh, ttl=release_ttl) if use_network else None
+
     if here:
         project_name = Path.cwd().name
         project_path = Path.cwd()
@@ -1008,6 +1793,7 @@ def init(
 
     if not here:
         setup_lines.append(f"{'Target Path':<15} [dim]{project_path}[/dim]")
+    setup_lines.append(f"{'Template Source':<15} [dim]{source.describe()}[/dim]")
 
     console.print(Panel("\n".join(setup_lines), border_style="cyan", padding=(1, 2)))
 
@@ -1017,11 +1803,14 @@ def init(
         if not should_init_git:
             console.print("[yellow]Git not found - will skip repository initialization[/yellow]")
 
+    extra_agents = []
     if ai_assistant:
-        if ai_assistant not in AGENT_CONFIG:
-            console.print(f"[red]Error:[/red] Invalid AI assistant '{ai_assistant}'. Choose from: {', '.join(AGENT_CONFIG.keys())}")
+        requested = list(dict.fromkeys(a.strip() for a in ai_assistant.split(",") if a.strip()))
+        invalid = [a for a in requested if a not in AGENT_CONFIG]
+        if invalid or not requested:
+            console.print(f"[red]Error:[/red] Invalid AI assistant '{', '.join(invalid) or ai_assistant}'. Choose from: {', '.join(AGENT_CONFIG.keys())}")
             raise typer.Exit(1)
-        selected_ai = ai_assistant
+        selected_ai, extra_agents = requested[0], requested[1:]
     else:
         # Create options dict for selection (agent_key: display_name)
         ai_choices = {key: config["name"] for key, config in AGENT_CONFIG.items()}
@@ -1032,12 +1821,14 @@ def init(
         )
 
     if not ignore_agent_tools:
-        agent_config = AGENT_CONFIG.get(selected_ai)
-        if agent_config and agent_config["requires_cli"]:
+        for agent in [selected_ai, *extra_agents]:
+            agent_config = AGENT_CONFIG.get(agent)
+            if not (agent_config and agent_config["requires_cli"]):
+                continue
             install_url = agent_config["install_url"]
-            if not check_tool(selected_ai):
+            if not check_tool(agent):
                 error_panel = Panel(
-                    f"[cyan]{selected_ai}[/cyan] not found\n"
+                    f"[cyan]{agent}[/cyan] not found\n"
                     f"Install from: [cyan]{install_url}[/cyan]\n"
                     f"{agent_config['name']} is required to continue with this project type.\n\n"
                     "Tip: Use [cyan]--ignore-agent-tools[/cyan] to skip this check",
@@ -1062,7 +1853,7 @@ def init(
         else:
             selected_script = default_script
 
-    console.print(f"[cyan]Selected AI assistant:[/cyan] {selected_ai}")
+    console.print(f"[cyan]Selected AI assistant:[/cyan] {', '.join([selected_ai, *extra_agents])}")
     console.print(f"[cyan]Selected script type:[/cyan] {selected_script}")
 
     tracker = StepTracker("Initialize Persona Kit Project")
@@ -1072,7 +1863,7 @@ def init(
     tracker.add("precheck", "Check required tools")
     tracker.complete("precheck", "ok")
     tracker.add("ai-select", "Select AI assistant")
-    tracker.complete("ai-select", f"{selected_ai}")
+    tracker.complete("ai-select", ", ".join([selected_ai, *extra_agents]))
     tracker.add("script-select", "Select script type")
     tracker.complete("script-select", selected_script)
     for key, label in [
@@ -1094,13 +1885,12 @@ def init(
     with Live(tracker.render(), console=console, refresh_per_second=8, transient=True) as live:
         tracker.attach_refresh(lambda: live.update(tracker.render()))
         try:
-            verify = not skip_tls
-            local_ssl_context = ssl_context if verify else False
-            local_client = httpx.Client(verify=local_ssl_context)
-
-            download_and_extract_template(project_path, selected_ai, selected_script, here, verbose=False, tracker=tracker, client=local_client, debug=debug, github_token=github_token)
+            release_data = None
+            if prefetch:
+                tracker.start("fetch", "waiting for release information")
+                release_data = prefetch.result()
 
-            ensure_executable_scripts(project_path, tracker=tracker)
+            download_and_extract_template(project_path, selected_ai, selected_script, here, verbose=False, tracker=tracker, client=local_client, debug=debug, github_token=github_token, offline=offline, use_cache=not no_cache, refresh=refresh, release_ttl=release_ttl, download_segments=download_segments, materialize=materialize, release_data=release_data, extra_agents=tuple(extra_agents), source=source)
 
             if not no_git:
                 tracker.start("git")
@@ -1139,6 +1929,8 @@ def init(
 
     console.print(tracker.render())
     console.print("\n[bold green]Project ready.[/bold green]")
+    if stats:
+        console.print(stats.render())
 
     # Show git error details if initialization failed
     if git_error_message:
@@ -1158,9 +1950,9 @@ def init(
         console.print(git_error_panel)
 
     # Agent folder security notice
-    agent_config = AGENT_CONFIG.get(selected_ai)
-    if agent_config:
-        agent_folder = agent_config["folder"]
+    agent_folders = [AGENT_CONFIG[a]["folder"] for a in [selected_ai, *extra_agents] if a in AGENT_CONFIG]
+    if agent_folders:
+        agent_folder = ", ".join(agent_folders)
         security_notice = Panel(
             f"Some agents may store credentials, auth tokens, or other identifying and private artifacts in the agent folder within your project.\n"
             f"Consider adding [cyan]{agent_folder}[/cyan] (or parts of it) to [cyan].gitignore[/cyan] to prevent accidental credential leakage.",
@@ -1191,6 +1983,218 @@ def init(
     console.print()
     console.print(steps_panel)
 
+def load_batch_manifest(manifest: Path) -> list:
+    """Read an init-batch manifest into a list of {path, ai, script} entries.
+
+    The manifest is YAML: a list of entries or a mapping with a ``projects``
+    list. Each entry needs ``path`` and ``ai``; ``script`` defaults like
+    ``init``. Relative paths resolve against the manifest's directory.
+    Raises ValueError describing the first invalid entry.
+    """
+    import yaml
+
+    data = yaml.safe_load(manifest.read_text(encoding="utf-8"))
+    entries = data.get("projects") if isinstance(data, dict) else data
+    if not isinstance(entries, list) or not entries:
+        raise ValueError("manifest must contain a non-empty 'projects' list")
+
+    default_script = "ps" if os.name == "nt" else "sh"
+    projects = []
+    seen = set()
+    for index, entry in enumerate(entries, 1):
+        if not isinstance(entry, dict) or not entry.get("path"):
+            raise ValueError(f"entry {index}: 'path' is required")
+        ai = entry.get("ai")
+        if ai not in AGENT_CONFIG:
+            raise ValueError(f"entry {index}: invalid AI assistant '{ai}'. Choose from: {', '.join(AGENT_CONFIG.keys())}")
+        script = entry.get("script") or default_script
+        if script not in SCRIPT_TYPE_CHOICES:
+            raise ValueError(f"entry {index}: invalid script type '{script}'. Choose from: {', '.join(SCRIPT_TYPE_CHOICES.keys())}")
+        path = (manifest.parent / str(entry["path"])).expanduser().resolve()
+        if path in seen:
+            raise ValueError(f"entry {index}: duplicate project path {path}")
+        seen.add(path)
+        projects.append({"path": path, "ai": ai, "script": script})
+    return projects
+
+@app.command("init-batch")
+def init_batch(
+    manifest: Path = typer.Argument(..., exists=True, dir_okay=False, help="YAML manifest listing the projects to create (path, ai, script)"),
+    jobs: int = typer.Option(4, "--jobs", "-j", min=1, help="Number of projects extracted and initialized concurrently"),
+    no_git: bool = typer.Option(False, "--no-git", help="Skip git repository initialization"),
+    skip_tls: bool = typer.Option(False, "--skip-tls", help="Skip SSL/TLS verification (not recommended)"),
+    debug: bool = typer.Option(False, "--debug", help="Show verbose diagnostic output for network and extraction failures"),
+    github_token: str = typer.Option(None, "--github-token", help="GitHub token to use for API requests (or set GH_TOKEN or GITHUB_TOKEN environment variable)"),
+    offline: bool = typer.Option(False, "--offline", help="Use the newest cached templates instead of contacting GitHub"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Don't read or write the template cache; download into a temporary directory"),
+    refresh: bool = typer.Option(False, "--refresh", help="Ignore cached release information and query GitHub again"),
+    release_ttl: int = typer.Option(None, "--release-ttl", help="Seconds to reuse cached release information without revalidating (default 300, or PERSONA_KIT_RELEASE_TTL)"),
+    materialize: str = typer.Option("extract", "--materialize", envvar="PERSONA_KIT_MATERIALIZE", help="How to create projects from a cached template: extract, reflink, hardlink (shares files with the cache) or copy"),
+    template_source: str = typer.Option(None, "--template-source", help="Where templates come from: github (default), github:owner/repo, an http(s) mirror URL, a template zip or an unpacked template directory (or set PERSONA_KIT_TEMPLATE_SOURCE)"),
+):
+    """
+    Initialize several projects from a manifest in one run.
+
+    Release metadata is fetched once and each distinct template is downloaded
+    once; extraction and git initialization then run across a worker pool.
+    Agent tool checks are skipped, as with init --ignore-agent-tools.
+
+    Example manifest:
+
+        projects:
+          - path: services/api
+            ai: claude
+            script: sh
+          - path: services/web
+            ai: copilot
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    from rich.live import Live
+    from .cache import MATERIALIZE_MODES
+    from .sources import load_template_source
+
+    show_banner()
+    source = load_template_source(template_source)
+
+    if materialize not in MATERIALIZE_MODES:
+        console.print(f"[red]Error:[/red] Invalid materialize mode '{materialize}'. Choose from: {', '.join(MATERIALIZE_MODES)}")
+        raise typer.Exit(1)
+
+    try:
+        projects = load_batch_manifest(manifest)
+    except Exception as e:
+        console.print(Panel(f"{manifest}\n{e}", title="[red]Invalid Manifest[/red]", border_style="red", padding=(1, 2)))
+        raise typer.Exit(1)
+
+    existing = [str(p["path"]) for p in projects if p["path"].exists()]
+    if existing:
+        console.print(Panel(
+            "These project directories already exist:\n" + "\n".join(f"  - [cyan]{path}[/cyan]" for path in existing) +
+            "\n\nRemove them or drop them from the manifest.",
+            title="[red]Directory Conflict[/red]",
+            border_style="red",
+            padding=(1, 2),
+        ))
+        raise typer.Exit(1)
+
+    should_init_git = False
+    if not no_git:
+        should_init_git = check_tool("git")
+        if not should_init_git:
+            console.print("[yellow]Git not found - will skip repository initialization[/yellow]")
+
+    combos = sorted({(p["ai"], p["script"]) for p in projects})
+    console.print(f"[cyan]Projects:[/cyan] {len(projects)}  [cyan]Templates:[/cyan] {len(combos)}  [cyan]Jobs:[/cyan] {jobs}")
+
+    tracker = StepTracker(f"Initialize {len(projects)} Persona Kit Projects")
+    sys._persona_kit_tracker_active = True
+
+    tracker.add("fetch", "Fetch latest release")
+    for ai, script in combos:
+        tracker.add(f"download:{ai}-{script}", f"Download {template_asset_pattern(ai, script)}")
+    for project in projects:
+        tracker.add(f"project:{project['path']}", f"{project['path']} - {project['ai']}/{project['script']}")
+
+    archives = {}
+    git_errors = {}
+    failed = 0
+    tmp_dir = Path(tempfile.mkdtemp(prefix="persona-kit-batch-")) if no_cache else None
+
+    def failure_detail(e: Exception) -> str:
+        # typer.Exit carries only an exit code; its details were already printed
+        return "failed, see errors above" if isinstance(e, typer.Exit) else str(e)
+
+    def fetch_template(combo: Tuple[str, str]) -> bool:
+        ai, script = combo
+        key = f"download:{ai}-{script}"
+        tracker.start(key)
+        try:
+            archive, meta = source.fetch(ai, script, download_dir=tmp_dir, verbose=False, show_progress=False, client=local_client, debug=debug, github_token=github_token, offline=offline, use_cache=not no_cache, release_data=release_data)
+        except Exception as e:
+            tracker.error(key, failure_detail(e))
+            return False
+        archives[combo] = (archive, meta)
+        if meta.get("local"):
+            tracker.skip(key, f"local {meta['filename']}")
+        else:
+            tracker.complete(key, "cached" if meta["cache_hit"] else f"{meta['size']:,} bytes")
+        return True
+
+    def build_project(project: dict) -> bool:
+        key = f"project:{project['path']}"
+        fetched = archives.get((project["ai"], project["script"]))
+        if fetched is None:
+            tracker.skip(key, "template unavailable")
+            return False
+        archive, meta = fetched
+
+        tracker.start(key, "extracting")
+        # A private tracker collects this project's step errors for the combined view
+        project_tracker = StepTracker(str(project["path"]))
+        try:
+            install = {"ai": project["ai"], "script": project["script"], "agents": [project["ai"]]}
+            summary = extract_template_archive(archive, meta, project["path"], verbose=False, tracker=project_tracker, debug=debug, materialize=materialize, install=install)
+        except Exception as e:
+            detail = next((step["detail"] for step in project_tracker.steps if step["status"] == "error"), failure_detail(e))
+            tracker.error(key, detail)
+            return False
+
+        git_detail = "no git"
+        if should_init_git:
+            tracker.start(key, "initializing git")
+            if is_git_repo(project["path"]):
+                git_detail = "existing repo detected"
+            else:
+                success, error_msg = init_git_repo(project["path"], quiet=True)
+                if not success:
+                    git_errors[project["path"]] = error_msg
+                    tracker.error(key, f"{summary['files']} files, git init failed")
+                    return False
+                git_detail = "git initialized"
+        tracker.complete(key, f"{summary['files']} files, {git_detail}")
+        return True
+
+    stats = ConnectionStats() if debug else None
+    with Live(tracker.render(), console=console, refresh_per_second=8, transient=True) as live:
+        tracker.attach_refresh(lambda: live.update(tracker.render()))
+        local_client = None
+        release_data = None
+        try:
+            if not source.remote:
+                tracker.skip("fetch", source.describe())
+            elif offline:
+                tracker.skip("fetch", "offline: using template cache")
+            else:
+                local_client = create_http_client(verify=not skip_tls, max_connections=jobs, stats=stats)
+                tracker.start("fetch", f"contacting {source.describe()}")
+                try:
+                    release_data = source.release_data(local_client, github_token, refresh=refresh, ttl=release_ttl)
+                except Exception as e:
+                    tracker.error("fetch", failure_detail(e))
+                    raise typer.Exit(1)
+                tracker.complete("fetch", f"release {release_data['tag_name']}")
+
+            with ThreadPoolExecutor(max_workers=jobs) as pool:
+                list(pool.map(fetch_template, combos))
+                failed = sum(1 for ok in pool.map(build_project, projects) if not ok)
+        finally:
+            if local_client is not None:
+                local_client.close()
+            if tmp_dir is not None:
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    console.print(tracker.render())
+    if stats and stats.hosts:
+        console.print(stats.render())
+
+    for path, error_msg in git_errors.items():
+        console.print(Panel(f"{path}\n\n{error_msg}", title="[red]Git Initialization Failed[/red]", border_style="red", padding=(1, 2)))
+
+    if failed:
+        console.print(f"\n[bold red]{len(projects) - failed} of {len(projects)} projects ready.[/bold red]")
+        raise typer.Exit(1)
+    console.print(f"\n[bold green]All {len(projects)} projects ready.[/bold green]")
+
 @app.command()
 def check():
     """Check that all required tools are installed."""
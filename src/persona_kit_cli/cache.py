@@ -0,0 +1,602 @@
+#!/usr/bin/env python3
+"""
+Template cache for Persona Kit CLI.
+
+This module keeps downloaded release templates in the user cache directory so
+that repeated `init` runs against the same release skip the network entirely.
+Archives are stored content-addressed by sha256 and indexed by release tag and
+asset name. Release metadata is cached alongside with its HTTP validators so
+it can be revalidated with conditional requests. Archives can also be kept
+extracted so new projects are materialized by reflinking or hardlinking files
+instead of decompressing them again.
+"""
+
+import os
+import sys
+import json
+import time
+import errno
+import zipfile
+import threading
+import hashlib
+import shutil
+import tempfile
+import contextlib
+from pathlib import Path
+from typing import Optional, Dict, Any, List, BinaryIO, Iterator
+
+import typer
+from platformdirs import user_cache_dir
+from rich.console import Console
+
+console = Console()
+
+app = typer.Typer(
+    name="cache",
+    help="Manage the local template cache",
+    add_completion=False,
+)
+
+CACHE_DIR_ENV = "PERSONA_KIT_CACHE_DIR"
+RELEASE_TTL_ENV = "PERSONA_KIT_RELEASE_TTL"
+DEFAULT_RELEASE_TTL = 300  # seconds a cached release response is used without revalidation
+
+def default_cache_dir() -> Path:
+    """Return the cache root, honouring PERSONA_KIT_CACHE_DIR over the platform default."""
+    override = os.getenv(CACHE_DIR_ENV, "").strip()
+    if override:
+        return Path(override).expanduser()
+    return Path(user_cache_dir("persona-kit", appauthor=False))
+
+def release_ttl(override: Optional[int] = None) -> int:
+    """Return the release metadata TTL in seconds (explicit value, then env var, then default)."""
+    if override is not None:
+        return max(0, override)
+    try:
+        return max(0, int(os.getenv(RELEASE_TTL_ENV, DEFAULT_RELEASE_TTL)))
+    except ValueError:
+        return DEFAULT_RELEASE_TTL
+
+def _write_json_atomic(path: Path, data: Dict[str, Any]) -> None:
+    """Write JSON to a temp file beside ``path`` and rename it into place."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.stem}-", suffix=".json")
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_name, path)
+    except Exception:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+@contextlib.contextmanager
+def _open_replacing(path: Path) -> Iterator[BinaryIO]:
+    """Open a temp file beside ``path`` for writing and rename it over ``path`` on success.
+
+    Replacing instead of writing in place breaks hardlinks, so a project file
+    linked to a cached tree never writes through to the cache. An existing
+    file keeps its permission bits (made writable by the owner).
+    """
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o666)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            if os.name != "nt" and os.path.lexists(path):
+                os.fchmod(f.fileno(), (path.stat().st_mode & 0o7777) | 0o200)
+            yield f
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+@contextlib.contextmanager
+def _file_lock(path: Path) -> Iterator[None]:
+    """Hold an exclusive lock on ``path`` (created if missing), shared with other processes."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'a+b') as f:
+        if os.name == "nt":
+            import msvcrt
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+def _make_read_only(tree: Path) -> None:
+    """Clear the write bits of every file under ``tree``."""
+    for root, _, filenames in os.walk(tree):
+        for name in filenames:
+            path = os.path.join(root, name)
+            os.chmod(path, os.stat(path).st_mode & ~0o222)
+
+def sha256_file(path: Path, chunk_size: int = 1024 * 1024) -> str:
+    """Return the hex sha256 digest of a file."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+class TemplateCache:
+    """Content-addressed store of template archives keyed by release tag and asset name."""
+
+    # Serializes index updates between threads; index.json.lock covers other processes
+    _index_lock = threading.Lock()
+
+    def __init__(self, root: Optional[Path] = None):
+        self.root = Path(root) if root else default_cache_dir()
+        self.templates_dir = self.root / "templates"
+        self.blobs_dir = self.templates_dir / "blobs"
+        self.downloads_dir = self.templates_dir / "downloads"
+        self.trees_dir = self.templates_dir / "trees"
+        self.index_file = self.templates_dir / "index.json"
+        self.index_lock_file = self.templates_dir / "index.json.lock"
+
+    @staticmethod
+    def key(tag_name: str, asset_name: str) -> str:
+        """Return the index key for a release asset."""
+        return f"{tag_name}/{asset_name}"
+
+    def blob_path(self, sha256: str) -> Path:
+        """Return the on-disk location of an archive with the given digest."""
+        return self.blobs_dir / f"{sha256}.zip"
+
+    def load_index(self) -> Dict[str, Any]:
+        """Load the cache index, returning an empty index if missing or unreadable."""
+        if not self.index_file.exists():
+            return {"entries": {}, "version": "1.0"}
+
+        try:
+            with open(self.index_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            console.print(f"[yellow]Warning: Could not load template cache index:[/yellow] {e}")
+            return {"entries": {}, "version": "1.0"}
+
+    def save_index(self, index: Dict[str, Any]) -> None:
+        """Atomically write the cache index."""
+        _write_json_atomic(self.index_file, index)
+
+    @contextlib.contextmanager
+    def locked_index(self) -> Iterator[Dict[str, Any]]:
+        """Load the index for a read-modify-write and save it on exit, holding the index lock throughout."""
+        with self._index_lock, _file_lock(self.index_lock_file):
+            index = self.load_index()
+            yield index
+            self.save_index(index)
+
+    def _with_path(self, entry: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Return the entry with its blob path, or None if the blob is gone or truncated."""
+        path = self.blob_path(entry["sha256"])
+        try:
+            if path.stat().st_size != entry["size"]:
+                return None
+        except OSError:
+            return None
+        return {**entry, "path": path}
+
+    def lookup(self, tag_name: str, asset_name: str, sha256: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Return the cached entry for a release asset, or None on a miss.
+
+        When ``sha256`` is given (e.g. from the release metadata) the cached
+        archive must have that digest to count as a hit.
+        """
+        entry = self.load_index()["entries"].get(self.key(tag_name, asset_name))
+        if entry is None:
+            return None
+        if sha256 and entry["sha256"] != sha256:
+            return None
+        return self._with_path(entry)
+
+    def find_latest(self, pattern: str) -> Optional[Dict[str, Any]]:
+        """Return the most recently stored entry whose asset name contains ``pattern``."""
+        candidates = [
+            entry for entry in self.load_index()["entries"].values()
+            if pattern in entry["asset_name"] and entry["asset_name"].endswith(".zip")
+        ]
+        for entry in sorted(candidates, key=lambda e: e.get("stored_at", 0), reverse=True):
+            resolved = self._with_path(entry)
+            if resolved:
+                return resolved
+        return None
+
+    def store(self, tag_name: str, asset_name: str, archive: Path, sha256: Optional[str] = None) -> Dict[str, Any]:
+        """Move a downloaded archive into the cache and index it.
+
+        ``sha256`` is the digest computed while downloading; it is only
+        recomputed from disk when not given. Returns the new entry; its
+        ``path`` points at the cached blob, which must be treated as
+        read-only by callers.
+        """
+        archive = Path(archive)
+        sha256 = sha256 or sha256_file(archive)
+        size = archive.stat().st_size
+        dest = self.blob_path(sha256)
+
+        self.blobs_dir.mkdir(parents=True, exist_ok=True)
+        if dest.exists() and dest.stat().st_size == size:
+            archive.unlink()
+        else:
+            tmp_path = self.blobs_dir / f".{sha256}.{os.getpid()}.tmp"
+            try:
+                shutil.move(str(archive), str(tmp_path))
+                os.replace(tmp_path, dest)
+            except Exception:
+                tmp_path.unlink(missing_ok=True)
+                raise
+
+        entry = {
+            "tag_name": tag_name,
+            "asset_name": asset_name,
+            "sha256": sha256,
+            "size": size,
+            "stored_at": time.time(),
+        }
+        with self.locked_index() as index:
+            index["entries"][self.key(tag_name, asset_name)] = entry
+        return {**entry, "path": dest}
+
+    def tree_path(self, sha256: str) -> Path:
+        """Return the extracted tree location for an archive digest."""
+        return self.trees_dir / sha256
+
+    def tree_digests_path(self, sha256: str) -> Path:
+        """Return where the sha256 of every file in an extracted tree is recorded."""
+        return self.trees_dir / f"{sha256}.files.json"
+
+    def tree_digests(self, sha256: str) -> Optional[Dict[str, str]]:
+        """Return the file digests of an extracted tree keyed by "/"-separated path.
+
+        They are recorded when the tree is extracted; for trees without a
+        record they are computed from the tree once and stored. Returns None
+        if the tree doesn't exist.
+        """
+        path = self.tree_digests_path(sha256)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            pass
+
+        tree = self.tree_path(sha256)
+        if not tree.is_dir():
+            return None
+        digests = {}
+        for root, _, filenames in os.walk(tree):
+            for name in filenames:
+                file_path = Path(root) / name
+                digests[file_path.relative_to(tree).as_posix()] = sha256_file(file_path)
+        try:
+            _write_json_atomic(path, digests)
+        except OSError:
+            pass
+        return digests
+
+    def ensure_tree(self, sha256: str, archive: Path, extract) -> Path:
+        """Return the extracted tree for a cached archive, extracting it on first use.
+
+        ``extract(zip_ref, dest)`` writes the archive into ``dest`` and
+        returns a summary; its ``digests`` are recorded beside the tree (see
+        tree_digests). The tree is built in a staging directory and renamed
+        into place, so a tree that exists is always complete. Its files are
+        made read-only, since projects materialized with hardlinks share them.
+        """
+        tree = self.tree_path(sha256)
+        if tree.is_dir():
+            return tree
+
+        staging = self.trees_dir / f".{sha256}.{os.getpid()}.{threading.get_ident()}.tmp"
+        shutil.rmtree(staging, ignore_errors=True)
+        staging.mkdir(parents=True)
+        try:
+            with zipfile.ZipFile(archive, 'r') as zip_ref:
+                summary = extract(zip_ref, staging)
+            if isinstance(summary, dict) and summary.get("digests") is not None:
+                _write_json_atomic(self.tree_digests_path(sha256), summary["digests"])
+            _make_read_only(staging)
+            os.replace(staging, tree)
+        except OSError:
+            shutil.rmtree(staging, ignore_errors=True)
+            # Another process may have finished the same tree first
+            if not tree.is_dir():
+                raise
+        except Exception:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+        return tree
+
+MATERIALIZE_MODES = ("extract", "reflink", "hardlink", "copy")
+
+# Errors meaning "this filesystem pair can't clone/link", so stop trying for the run
+_LINK_UNSUPPORTED = {errno.EXDEV, errno.EOPNOTSUPP, errno.ENOTTY, errno.EINVAL, errno.EPERM, errno.EMLINK}
+
+def _reflink(src: Path, dst: Path) -> None:
+    """Clone ``src`` to ``dst`` sharing extents (FICLONE on btrfs/xfs); raises OSError if unsupported."""
+    if not sys.platform.startswith("linux"):
+        raise OSError(errno.EOPNOTSUPP, "reflink is only supported on Linux")
+    import fcntl
+
+    FICLONE = 0x40049409
+    with open(src, 'rb') as s, open(dst, 'wb') as d:
+        try:
+            fcntl.ioctl(d.fileno(), FICLONE, s.fileno())
+        except OSError:
+            d.close()
+            dst.unlink(missing_ok=True)
+            raise
+    shutil.copymode(src, dst)
+
+def materialize_tree(tree: Path, dest: Path, mode: str = "reflink") -> Dict[str, Any]:
+    """Recreate an extracted template tree under ``dest`` using cheap file operations.
+
+    ``reflink`` clones files copy-on-write, ``hardlink`` shares the cached
+    inodes (which are read-only, so tools must replace files rather than
+    write them in place) and ``copy`` copies bytes. Files that can't be
+    reflinked or hardlinked are copied instead, and after the first
+    unsupported error the remaining files go straight to copying. Existing
+    files under ``dest`` are replaced, never written through. Permission
+    bits come from the tree, with cloned and copied files left writable.
+    Returns a summary like extract_template_members with per-method counts.
+    """
+    counts = {"reflink": 0, "hardlink": 0, "copy": 0}
+    top_level = sorted(entry.name for entry in os.scandir(tree))
+    link_supported = mode in ("reflink", "hardlink")
+    files = executables = 0
+
+    for root, dirs, filenames in os.walk(tree):
+        rel_root = Path(root).relative_to(tree)
+        target_root = dest / rel_root
+        target_root.mkdir(parents=True, exist_ok=True)
+        for name in filenames:
+            src, dst = Path(root) / name, target_root / name
+            # Build over an existing file beside it and rename, so its links are broken
+            out = dst.with_name(f".{name}.{os.getpid()}.tmp") if os.path.lexists(dst) else dst
+            method = "copy"
+            if link_supported:
+                try:
+                    if mode == "reflink":
+                        _reflink(src, out)
+                    else:
+                        os.link(src, out)
+                    method = mode
+                except OSError as e:
+                    if e.errno in _LINK_UNSUPPORTED:
+                        link_supported = False
+            if method == "copy":
+                shutil.copy2(src, out)
+            if method != "hardlink":
+                os.chmod(out, os.stat(out).st_mode | 0o200)
+            if out != dst:
+                os.replace(out, dst)
+            counts[method] += 1
+            files += 1
+            if os.name != "nt" and os.stat(dst).st_mode & 0o100:
+                executables += 1
+
+    return {"files": files, "top_level": top_level, "flattened": False, "counts": counts, "executables": executables}
+
+class ReleaseCache:
+    """Cached GitHub release responses together with their ETag/Last-Modified validators."""
+
+    def __init__(self, root: Optional[Path] = None, api_url: Optional[str] = None):
+        self.root = Path(root) if root else default_cache_dir()
+        self.releases_dir = self.root / "releases"
+        # Responses from a non-default API (mirror, local release server) are kept apart
+        self.namespace = hashlib.sha256(api_url.encode()).hexdigest()[:12] + "__" if api_url else ""
+
+    def entry_path(self, repo_owner: str, repo_name: str) -> Path:
+        """Return the cache file for a repository's latest release."""
+        return self.releases_dir / f"{self.namespace}{repo_owner}__{repo_name}.json"
+
+    def load(self, repo_owner: str, repo_name: str) -> Optional[Dict[str, Any]]:
+        """Return the cached response entry, or None if missing or unreadable."""
+        path = self.entry_path(repo_owner, repo_name)
+        if not path.exists():
+            return None
+
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+            return entry if "data" in entry else None
+        except Exception:
+            return None
+
+    def is_fresh(self, entry: Dict[str, Any], ttl: int) -> bool:
+        """Return True if the entry is younger than ``ttl`` seconds."""
+        return ttl > 0 and (time.time() - entry.get("fetched_at", 0)) < ttl
+
+    def conditional_headers(self, entry: Optional[Dict[str, Any]]) -> Dict[str, str]:
+        """Return If-None-Match/If-Modified-Since headers for revalidating an entry."""
+        headers = {}
+        if entry:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def save(self, repo_owner: str, repo_name: str, data: Dict[str, Any], etag: Optional[str] = None, last_modified: Optional[str] = None) -> Dict[str, Any]:
+        """Store a release response and its validators."""
+        entry = {
+            "etag": etag,
+            "last_modified": last_modified,
+            "fetched_at": time.time(),
+            "data": data,
+        }
+        try:
+            _write_json_atomic(self.entry_path(repo_owner, repo_name), entry)
+        except OSError as e:
+            console.print(f"[yellow]Warning: Could not cache release metadata:[/yellow] {e}")
+        return entry
+
+    def touch(self, repo_owner: str, repo_name: str, entry: Dict[str, Any]) -> Dict[str, Any]:
+        """Mark an entry as revalidated now (after a 304 Not Modified)."""
+        return self.save(repo_owner, repo_name, entry["data"], entry.get("etag"), entry.get("last_modified"))
+
+
+async def _download_into_cache(client, cache: TemplateCache, item: Dict[str, Any], headers: Dict[str, str], tracker, retries: int) -> None:
+    """Stream one release asset into the template cache, verifying its sha256."""
+    import asyncio
+    import httpx
+    from . import DOWNLOAD_BACKOFF_BASE, DOWNLOAD_BACKOFF_MAX, DOWNLOAD_CHUNK_SIZE
+
+    key, tag_name, asset = item["key"], item["tag_name"], item["asset"]
+    download_dir = cache.downloads_dir / tag_name
+    download_dir.mkdir(parents=True, exist_ok=True)
+    tmp_path = download_dir / f"{asset['name']}.warm-{os.getpid()}"
+
+    tracker.start(key, "downloading")
+    for attempt in range(retries + 1):
+        digest = hashlib.sha256()
+        try:
+            async with client.stream("GET", asset["browser_download_url"], headers=headers) as response:
+                if response.status_code >= 500 or response.status_code == 429:
+                    raise httpx.HTTPStatusError(f"HTTP {response.status_code}", request=response.request, response=response)
+                response.raise_for_status()
+                with open(tmp_path, 'wb') as f:
+                    async for chunk in response.aiter_bytes(DOWNLOAD_CHUNK_SIZE):
+                        f.write(chunk)
+                        digest.update(chunk)
+            break
+        except (httpx.TransportError, httpx.HTTPStatusError) as e:
+            retryable = not isinstance(e, httpx.HTTPStatusError) or e.response.status_code >= 500 or e.response.status_code == 429
+            if not retryable or attempt >= retries:
+                tmp_path.unlink(missing_ok=True)
+                raise
+            await asyncio.sleep(min(DOWNLOAD_BACKOFF_BASE * (2 ** attempt), DOWNLOAD_BACKOFF_MAX))
+
+    actual = digest.hexdigest()
+    expected = item["sha256"]
+    if expected and actual != expected:
+        tmp_path.unlink(missing_ok=True)
+        raise ValueError(f"sha256 mismatch (expected {expected[:12]}…, got {actual[:12]}…)")
+
+    entry = cache.store(tag_name, asset["name"], tmp_path, sha256=actual)
+    tracker.complete(key, f"{entry['size']:,} bytes" + (" (sha256 verified)" if expected else ""))
+
+async def _warm_all(items: List[Dict[str, Any]], cache: TemplateCache, jobs: int, verify: bool, headers: Dict[str, str], tracker, retries: int, stats=None) -> int:
+    """Download all items with at most ``jobs`` concurrent requests; returns the number of failures."""
+    import asyncio
+    from . import create_async_http_client
+
+    semaphore = asyncio.Semaphore(jobs)
+
+    async with create_async_http_client(verify, max_connections=jobs, stats=stats) as client:
+        async def run(item: Dict[str, Any]) -> bool:
+            async with semaphore:
+                try:
+                    await _download_into_cache(client, cache, item, headers, tracker, retries)
+                    return True
+                except Exception as e:
+                    tracker.error(item["key"], str(e) or type(e).__name__)
+                    return False
+
+        results = await asyncio.gather(*(run(item) for item in items))
+    return sum(1 for ok in results if not ok)
+
+@app.callback()
+def cache_callback():
+    """Manage the local template cache."""
+
+@app.command()
+def warm(
+    ai_assistant: str = typer.Option(None, "--ai", help="Comma-separated AI assistants to warm (default: all)"),
+    script_type: str = typer.Option(None, "--script", help="Comma-separated script types to warm: sh, ps (default: both)"),
+    jobs: int = typer.Option(4, "--jobs", "-j", min=1, help="Number of concurrent downloads"),
+    skip_tls: bool = typer.Option(False, "--skip-tls", help="Skip SSL/TLS verification (not recommended)"),
+    github_token: str = typer.Option(None, "--github-token", help="GitHub token to use for API requests (or set GH_TOKEN or GITHUB_TOKEN environment variable)"),
+    refresh: bool = typer.Option(False, "--refresh", help="Ignore cached release information and query GitHub again"),
+    release_ttl: int = typer.Option(None, "--release-ttl", help="Seconds to reuse cached release information without revalidating"),
+    template_source: str = typer.Option(None, "--template-source", help="GitHub (default), github:owner/repo or an http(s) mirror URL (or set PERSONA_KIT_TEMPLATE_SOURCE)"),
+    debug: bool = typer.Option(False, "--debug", help="Show connection setup times"),
+):
+    """Download every agent/script template of the latest release into the cache.
+
+    Run it once (e.g. while building a container image) so later
+    ``persona-kit init`` calls for that release never touch the network.
+    Templates already cached are skipped.
+    """
+    import asyncio
+    from rich.live import Live
+    from . import (
+        AGENT_CONFIG, SCRIPT_TYPE_CHOICES, DOWNLOAD_RETRIES, ConnectionStats, StepTracker,
+        create_http_client, select_asset, asset_sha256,
+        fetch_checksum_manifest, template_asset_pattern,
+    )
+    from .sources import load_template_source
+
+    source = load_template_source(template_source)
+    if not source.remote:
+        console.print(f"[yellow]Nothing to warm:[/yellow] templates already come from local {source.describe()}")
+        return
+
+    def parse_choices(value: Optional[str], choices, label: str) -> List[str]:
+        if not value:
+            return list(choices)
+        selected = [v.strip() for v in value.split(",") if v.strip()]
+        invalid = [v for v in selected if v not in choices]
+        if invalid:
+            console.print(f"[red]Error:[/red] Invalid {label} '{', '.join(invalid)}'. Choose from: {', '.join(choices)}")
+            raise typer.Exit(1)
+        return selected
+
+    agents = parse_choices(ai_assistant, AGENT_CONFIG, "AI assistant")
+    scripts = parse_choices(script_type, SCRIPT_TYPE_CHOICES, "script type")
+
+    cache = TemplateCache()
+    stats = ConnectionStats() if debug else None
+    with create_http_client(verify=not skip_tls, stats=stats) as client:
+        release_data = source.release_data(client, github_token, refresh=refresh, ttl=release_ttl)
+        tag_name = release_data["tag_name"]
+        assets = release_data.get("assets", [])
+
+        tracker = StepTracker(f"Warm Template Cache ({tag_name})")
+        items = []
+        for agent in agents:
+            for script in scripts:
+                key = f"{agent}-{script}"
+                tracker.add(key, template_asset_pattern(agent, script))
+                asset = select_asset(assets, agent, script)
+                if asset is None:
+                    tracker.skip(key, "not in release")
+                    continue
+                sha256 = asset_sha256(asset)
+                if cache.lookup(tag_name, asset["name"], sha256):
+                    tracker.complete(key, "cached")
+                    continue
+                items.append({"key": key, "tag_name": tag_name, "asset": asset, "sha256": sha256})
+
+        if any(item["sha256"] is None for item in items):
+            checksums = fetch_checksum_manifest(client, assets, source.auth_headers(github_token))
+            for item in items:
+                item["sha256"] = item["sha256"] or checksums.get(item["asset"]["name"])
+
+    failed = 0
+    if items:
+        with Live(tracker.render(), console=console, refresh_per_second=8, transient=True) as live:
+            tracker.attach_refresh(lambda: live.update(tracker.render()))
+            failed = asyncio.run(_warm_all(items, cache, jobs, not skip_tls, source.auth_headers(github_token), tracker, DOWNLOAD_RETRIES, stats))
+
+    console.print(tracker.render())
+    if stats:
+        console.print(stats.render())
+    if failed:
+        console.print(f"\n[bold red]{failed} of {len(items)} downloads failed.[/bold red]")
+        raise typer.Exit(1)
+    console.print(f"\n[bold green]Template cache ready:[/bold green] {len(items)} downloaded, cache at {cache.root}")
+
+def main():
+    """Main entry point for cache command."""
+    app()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Git backend for Persona Kit CLI.
+
+All git calls made by `init` and the implement workflow go through
+GitBackend. Each operation uses as few git processes as possible (one
+``status --porcelain=v2 --branch`` answers both "is it clean" and "which
+branch"), every command runs with ``cwd`` set instead of changing the
+process directory, and repository discovery is memoized per path so
+concurrent callers (e.g. `init-batch` workers) don't repeat it. WorktreePool
+gives parallel task runs their own reusable working trees.
+"""
+
+import queue
+import shutil
+import subprocess
+import threading
+import contextlib
+from pathlib import Path
+from typing import Optional, Dict, Any, Iterator, Set, Tuple
+
+_toplevels: Dict[Path, Optional[Path]] = {}
+_toplevels_lock = threading.Lock()
+
+def discover_repo(path: Path) -> Optional[Path]:
+    """Return the top level of the work tree containing ``path``, or None (memoized per path)."""
+    path = Path(path).resolve()
+    with _toplevels_lock:
+        if path in _toplevels:
+            return _toplevels[path]
+
+    toplevel = None
+    if path.is_dir():
+        try:
+            result = subprocess.run(["git", "rev-parse", "--show-toplevel"], capture_output=True, text=True, cwd=path)
+            if result.returncode == 0 and result.stdout.strip():
+                toplevel = Path(result.stdout.strip())
+        except FileNotFoundError:
+            pass
+
+    with _toplevels_lock:
+        return _toplevels.setdefault(path, toplevel)
+
+def forget_repo(path: Path) -> None:
+    """Drop the memoized discovery result for ``path`` (after creating or removing a repository)."""
+    with _toplevels_lock:
+        _toplevels.pop(Path(path).resolve(), None)
+
+def parse_status_v2(output: str) -> Dict[str, Any]:
+    """Parse ``git status --porcelain=v2 --branch`` output into a status summary."""
+    status = {"branch": None, "commit": None, "upstream": None, "ahead": 0, "behind": 0, "changed": 0, "untracked": 0, "conflicted": 0, "paths": []}
+    for line in output.splitlines():
+        if line.startswith("# branch.oid "):
+            oid = line[len("# branch.oid "):]
+            status["commit"] = None if oid == "(initial)" else oid
+        elif line.startswith("# branch.head "):
+            head = line[len("# branch.head "):]
+            status["branch"] = None if head == "(detached)" else head
+        elif line.startswith("# branch.upstream "):
+            status["upstream"] = line[len("# branch.upstream "):]
+        elif line.startswith("# branch.ab "):
+            ahead, behind = line[len("# branch.ab "):].split()
+            status["ahead"], status["behind"] = int(ahead), -int(behind)
+        elif line.startswith("1 "):
+            status["changed"] += 1
+            status["paths"].append(line.split(" ", 8)[8])
+        elif line.startswith("2 "):
+            status["changed"] += 1
+            status["paths"].append(line.split(" ", 9)[9].split("\t")[0])
+        elif line.startswith("u "):
+            status["conflicted"] += 1
+            status["paths"].append(line.split(" ", 10)[10])
+        elif line.startswith("? "):
+            status["untracked"] += 1
+    status["clean"] = not (status["changed"] or status["untracked"] or status["conflicted"])
+    return status
+
+class GitBackend:
+    """Git operations for one working tree.
+
+    Failing commands raise subprocess.CalledProcessError with git's stderr
+    attached, so callers can report the command, exit code and message.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+
+    def run(self, *args: str, check: bool = True) -> subprocess.CompletedProcess:
+        """Run ``git <args>`` in the working tree and capture its output."""
+        return subprocess.run(["git", *args], check=check, capture_output=True, text=True, cwd=self.path)
+
+    def is_repo(self) -> bool:
+        """Return True if the path is inside a git work tree."""
+        return discover_repo(self.path) is not None
+
+    def status(self) -> Optional[Dict[str, Any]]:
+        """Return branch and working tree status from one git call, or None outside a repository."""
+        try:
+            result = self.run("status", "--porcelain=v2", "--branch", check=False)
+        except FileNotFoundError:
+            return None
+        if result.returncode != 0:
+            return None
+        return parse_status_v2(result.stdout)
+
+    def current_branch(self) -> Optional[str]:
+        """Return the checked-out branch, or None when detached or outside a repository."""
+        status = self.status()
+        return status["branch"] if status else None
+
+    def branch_exists(self, name: str) -> bool:
+        """Return True if a local branch called ``name`` exists."""
+        return self.run("rev-parse", "--verify", "--quiet", f"refs/heads/{name}", check=False).returncode == 0
+
+    def create_branch(self, name: str, start: Optional[str] = None) -> None:
+        """Create branch ``name`` at ``start`` (HEAD by default) and check it out."""
+        self.run("checkout", "-b", name, *([start] if start else []))
+
+    def checkout(self, ref: str) -> None:
+        """Check out a branch or commit."""
+        self.run("checkout", ref)
+
+    def has_staged_changes(self) -> bool:
+        """Return True if the index differs from HEAD."""
+        return self.run("diff", "--cached", "--quiet", check=False).returncode == 1
+
+    def commit_all(self, message: str) -> bool:
+        """Stage every change under the working tree path and commit it; returns False when there was nothing to commit."""
+        # Limit staging to this path: the project may be a subdirectory of a larger repository
+        self.run("add", "-A", "--", ".")
+        if not self.has_staged_changes():
+            return False
+        self.run("commit", "-m", message)
+        return True
+
+    def init_repo(self, message: str) -> None:
+        """Create a repository with everything in the working tree as its first commit."""
+        self.run("init")
+        forget_repo(self.path)
+        self.run("add", "-A")
+        self.run("commit", "-m", message)
+
+    def common_dir(self) -> Path:
+        """Return the repository's git directory shared by all of its worktrees."""
+        return (self.path / self.run("rev-parse", "--git-common-dir").stdout.strip()).resolve()
+
+    def worktrees(self) -> Set[Path]:
+        """Return the paths of the repository's registered worktrees."""
+        output = self.run("worktree", "list", "--porcelain").stdout
+        return {Path(line[len("worktree "):]).resolve() for line in output.splitlines() if line.startswith("worktree ")}
+
+    def merge(self, branch: str) -> Tuple[bool, str]:
+        """Merge ``branch`` into the checked-out branch; a conflicting merge is aborted.
+
+        Returns (merged, git's message).
+        """
+        result = self.run("merge", "--no-ff", "--no-edit", branch, check=False)
+        if result.returncode != 0:
+            self.run("merge", "--abort", check=False)
+        return result.returncode == 0, (result.stdout + result.stderr).strip()
+
+class WorktreePool:
+    """A fixed set of detached worktrees kept under the repository's git directory.
+
+    The worktrees survive between runs, so build outputs and other ignored
+    files in them (virtualenvs, node_modules, target/) are reused. ``open``
+    creates missing ones; ``checkout`` hands out a free worktree reset to a
+    fresh branch and detaches it again when released.
+    """
+
+    def __init__(self, git: GitBackend, size: int):
+        self.git = git
+        self.size = size
+        self.root = git.common_dir() / "persona-kit-worktrees"
+        self._free: "queue.Queue[GitBackend]" = queue.Queue()
+
+    def open(self, base: str) -> "WorktreePool":
+        """Make sure ``size`` worktrees exist, creating missing ones at commit ``base``."""
+        self.git.run("worktree", "prune")
+        registered = self.git.worktrees()
+        for i in range(self.size):
+            path = self.root / f"worker-{i}"
+            if path.resolve() not in registered:
+                shutil.rmtree(path, ignore_errors=True)
+                self.git.run("worktree", "add", "--detach", str(path), base)
+            self._free.put(GitBackend(path))
+        return self
+
+    @contextlib.contextmanager
+    def checkout(self, branch: str, base: str) -> Iterator[GitBackend]:
+        """Borrow a worktree with ``branch`` created at ``base`` and checked out in it."""
+        worktree = self._free.get()
+        try:
+            worktree.run("checkout", "--force", "-B", branch, base)
+            worktree.run("clean", "-fd")
+            yield worktree
+        finally:
+            # Release the branch so other worktrees and the main tree can use it
+            worktree.run("checkout", "--detach", check=False)
+            self._free.put(worktree)
@@ -6,9 +6,16 @@ This module handles the /persona-kit.implement workflow for executing
 implementation tasks and managing development processes.
 """
 
+import io
 import os
 import json
+import hashlib
+import shutil
+import threading
+import traceback
 import subprocess
+import importlib.util
+from collections import deque
 from pathlib import Path
 from typing import Optional, Dict, Any, List
 
@@ -18,8 +25,13 @@ from rich.panel import Panel
 from rich.prompt import Prompt, Confirm
 from rich.table import Table
 from rich.text import Text
+from rich.traceback import Traceback
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
+from .cache import _write_json_atomic
+from .git_backend import GitBackend, WorktreePool
+from .scheduler import TaskScheduler, TaskGraphError, task_key
+
 console = Console()
 
 app = typer.Typer(
@@ -28,13 +40,53 @@ app = typer.Typer(
     add_completion=False,
 )
 
+# Files that decide which test command a project uses
+TEST_MARKERS = ("package.json", "yarn.lock", "Cargo.toml", "go.mod", "pyproject.toml", "setup.py", "setup.cfg", "tox.ini", "pytest.ini", "conftest.py", "requirements.txt", "requirements-dev.txt")
+CONTENT_MARKERS = ("package.json", "pyproject.toml", "setup.cfg", "tox.ini", "requirements.txt", "requirements-dev.txt")
+
+def pytest_available() -> bool:
+    """Return True if pytest can be run here (importable or on PATH)."""
+    return importlib.util.find_spec("pytest") is not None or shutil.which("pytest") is not None
+
+TEST_COMMAND_CACHE = "test-command.json"
+
+TEST_OUTPUT_TAIL_BYTES = 64 * 1024
+
+class OutputTail:
+    """The most recent output lines, bounded to ``max_bytes``."""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.lines: deque = deque()
+        self.size = 0
+        self.truncated = False
+
+    def append(self, line: bytes) -> None:
+        self.lines.append(line)
+        self.size += len(line)
+        while self.size > self.max_bytes:
+            self.truncated = True
+            if len(self.lines) == 1:
+                self.lines[0] = self.lines[0][-self.max_bytes:]
+                self.size = len(self.lines[0])
+                break
+            self.size -= len(self.lines.popleft())
+
+    def text(self) -> str:
+        return b"".join(self.lines).decode("utf-8", "replace")
+
 class ImplementationManager:
     """Handles implementation execution for projects."""
 
-    def __init__(self, project_path: Path):
+    def __init__(self, project_path: Path, output: Optional[Console] = None, logs_dir: Optional[Path] = None):
         self.project_path = Path(project_path)
+        self.console = output or console
+        # Test output is forwarded live only to the real console; captured consoles get the tail
+        self.stream_tests = output is None
         self.implement_config = self.project_path / "persona-kit" / "implement.json"
         self.tasks_file = self.project_path / "persona-kit" / "tasks.json"
+        self.logs_dir = Path(logs_dir) if logs_dir else self.project_path / "persona-kit" / "logs"
+        self.git = GitBackend(self.project_path)
 
     def ensure_project_structure(self) -> bool:
         """Ensure the project structure exists."""
@@ -42,7 +94,7 @@ class ImplementationManager:
             self.implement_config.parent.mkdir(parents=True, exist_ok=True)
             return True
         except Exception as e:
-            console.print(f"[red]Error creating project structure:[/red] {e}")
+            self.console.print(f"[red]Error creating project structure:[/red] {e}")
             return False
 
     def load_implement_config(self) -> Dict[str, Any]:
@@ -62,7 +114,7 @@ class ImplementationManager:
             with open(self.implement_config, 'r', encoding='utf-8') as f:
                 return json.load(f)
         except Exception as e:
-            console.print(f"[yellow]Warning: Could not load implement config:[/yellow] {e}")
+            self.console.print(f"[yellow]Warning: Could not load implement config:[/yellow] {e}")
             return {
                 "settings": {
                     "auto_commit": True,
@@ -80,7 +132,7 @@ class ImplementationManager:
                 json.dump(config, f, indent=2, ensure_ascii=False)
             return True
         except Exception as e:
-            console.print(f"[red]Error saving implement config:[/red] {e}")
+            self.console.print(f"[red]Error saving implement config:[/red] {e}")
             return False
 
     def load_tasks(self) -> List[Dict[str, Any]]:
@@ -93,7 +145,7 @@ class ImplementationManager:
                 data = json.load(f)
                 return data.get("tasks", [])
         except Exception as e:
-            console.print(f"[yellow]Warning: Could not load tasks:[/yellow] {e}")
+            self.console.print(f"[yellow]Warning: Could not load tasks:[/yellow] {e}")
             return []
 
     def save_tasks(self, tasks: List[Dict[str, Any]]) -> bool:
@@ -104,149 +156,238 @@ class ImplementationManager:
                 json.dump(data, f, indent=2, ensure_ascii=False)
             return True
         except Exception as e:
-            console.print(f"[red]Error saving tasks:[/red] {e}")
+            self.console.print(f"[red]Error saving tasks:[/red] {e}")
             return False
 
     def is_git_repo(self) -> bool:
-        """Check if current directory is a git repository."""
-        try:
-            result = subprocess.run(
-                ["git", "rev-parse", "--is-inside-work-tree"],
-                check=True,
-                capture_output=True,
-                text=True,
-                cwd=self.project_path
-            )
-            return True
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            return False
+        """Check if the project directory is inside a git repository."""
+        return self.git.is_repo()
 
-    def create_branch(self, branch_name: str) -> bool:
-        """Create a new git branch."""
-        try:
-            # Check if branch already exists
-            result = subprocess.run(
-                ["git", "branch", "--list", branch_name],
-                capture_output=True,
-                text=True,
-                cwd=self.project_path
-            )
+    def create_branch(self, branch_name: str, start: Optional[str] = None) -> bool:
+        """Create a new git branch at ``start`` (HEAD by default) and switch to it.
 
-            if branch_name in result.stdout:
-                console.print(f"[yellow]Branch '{branch_name}' already exists.[/yellow]")
-                return True
+        An existing branch is an error rather than being reused, so a task
+        never commits on top of an earlier run's branch by accident.
+        """
+        try:
+            if self.git.branch_exists(branch_name):
+                self.console.print(f"[red]Error:[/red] Branch '{branch_name}' already exists; merge or delete it (git branch -D {branch_name}) to run the task again")
+                return False
 
-            # Create new branch
-            subprocess.run(
-                ["git", "checkout", "-b", branch_name],
-                check=True,
-                cwd=self.project_path
-            )
-            console.print(f"[green]Created and switched to branch '{branch_name}'[/green]")
+            self.git.create_branch(branch_name, start)
+            self.console.print(f"[green]Created and switched to branch '{branch_name}'[/green]")
             return True
-        except subprocess.CalledProcessError as e:
-            console.print(f"[red]Error creating branch:[/red] {e}")
+        except (subprocess.CalledProcessError, FileNotFoundError) as e:
+            self.console.print(f"[red]Error creating branch:[/red] {e}")
+            if getattr(e, "stderr", None):
+                self.console.print(e.stderr.strip())
             return False
 
     def commit_changes(self, message: str) -> bool:
         """Commit changes to git."""
         try:
-            # Add all changes
-            subprocess.run(
-                ["git", "add", "."],
-                check=True,
-                cwd=self.project_path
-            )
+            if not self.git.commit_all(message):
+                self.console.print("[yellow]No changes to commit.[/yellow]")
+                return True
+            self.console.print(f"[green]Committed changes: {message}[/green]")
+            return True
+        except (subprocess.CalledProcessError, FileNotFoundError) as e:
+            self.console.print(f"[red]Error committing changes:[/red] {e}")
+            if getattr(e, "stderr", None):
+                self.console.print(e.stderr.strip())
+            return False
+
+    def ensure_logs_dir(self) -> Path:
+        """Create the logs directory, which git ignores through its own .gitignore."""
+        self.logs_dir.mkdir(parents=True, exist_ok=True)
+        ignore_file = self.logs_dir / ".gitignore"
+        if not ignore_file.exists():
+            ignore_file.write_text("*\n", encoding="utf-8")
+        return self.logs_dir
+
+    def test_fingerprint(self) -> str:
+        """Return a digest of the test marker files (and whether pytest is installed), which decide the test command."""
+        digest = hashlib.sha256(b"pytest\0" if pytest_available() else b"")
+        for name in TEST_MARKERS:
+            path = self.project_path / name
+            if not path.is_file():
+                continue
+            digest.update(name.encode() + b"\0")
+            # Lockfiles and conftest.py only matter by their presence
+            if name in CONTENT_MARKERS:
+                digest.update(hashlib.sha256(path.read_bytes()).digest())
+        return digest.hexdigest()
+
+    def detect_test_command(self) -> Optional[List[str]]:
+        """Pick the test command from the project's marker files, or None if there is no test setup."""
+        def read(name: str) -> str:
+            try:
+                return (self.project_path / name).read_text(encoding="utf-8", errors="replace")
+            except OSError:
+                return ""
 
-            # Check if there are changes to commit
-            result = subprocess.run(
-                ["git", "diff", "--cached", "--name-only"],
-                capture_output=True,
-                text=True,
-                cwd=self.project_path
+        if (self.project_path / "package.json").is_file():
+            try:
+                scripts = json.loads(read("package.json")).get("scripts") or {}
+            except (ValueError, AttributeError):
+                scripts = {}
+            if "test" in scripts:
+                return ["yarn", "test"] if (self.project_path / "yarn.lock").is_file() else ["npm", "test"]
+        if (self.project_path / "Cargo.toml").is_file():
+            return ["cargo", "test"]
+        if (self.project_path / "go.mod").is_file():
+            return ["go", "test", "./..."]
+        if any((self.project_path / name).is_file() for name in ("pyproject.toml", "setup.py", "setup.cfg", "tox.ini", "pytest.ini", "requirements.txt")):
+            # pytest also runs unittest-style tests, so it is the default; plain
+            # unittest only when the project doesn't mention pytest and it isn't installed
+            uses_pytest = (
+                pytest_available()
+                or (self.project_path / "pytest.ini").is_file()
+                or (self.project_path / "conftest.py").is_file()
+                or any("pytest" in read(name) for name in ("pyproject.toml", "setup.cfg", "tox.ini", "requirements.txt", "requirements-dev.txt"))
             )
+            return ["python", "-m", "pytest"] if uses_pytest else ["python", "-m", "unittest"]
+        return None
+
+    def test_command(self) -> Optional[List[str]]:
+        """Return the project's test command, detecting it only when the marker files changed.
+
+        The result is cached with the marker fingerprint in the git-ignored
+        logs directory (TEST_COMMAND_CACHE), so it is reused across tasks and
+        runs without changing any file a task commits.
+        """
+        fingerprint = self.test_fingerprint()
+        cache_file = self.logs_dir / TEST_COMMAND_CACHE
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+            if cached.get("fingerprint") == fingerprint:
+                return cached.get("command")
+        except (OSError, ValueError, AttributeError):
+            pass
+
+        command = self.detect_test_command()
+        try:
+            self.ensure_logs_dir()
+            _write_json_atomic(cache_file, {"fingerprint": fingerprint, "command": command})
+        except OSError as e:
+            self.console.print(f"[yellow]Warning: Could not cache test command:[/yellow] {e}")
+        return command
+
+    def run_tests(self, label: str = "tests") -> bool:
+        """Run project tests with the detected test command.
+
+        Output is streamed line by line: forwarded to the console as it
+        arrives (unless this manager writes to a captured console), written
+        in full to ``persona-kit/logs/<label>.log``, and only the last
+        TEST_OUTPUT_TAIL_BYTES are kept in memory for the failure summary.
+        """
+        cmd = self.test_command()
+        if cmd is None:
+            self.console.print("[yellow]No test setup found (no pyproject.toml, package.json test script, Cargo.toml or go.mod).[/yellow]")
+            return False
 
-            if not result.stdout.strip():
-                console.print("[yellow]No changes to commit.[/yellow]")
-                return True
+        log_path = self.ensure_logs_dir() / f"{label}.log"
 
-            # Commit changes
-            subprocess.run(
-                ["git", "commit", "-m", message],
-                check=True,
-                cwd=self.project_path
-            )
-            console.print(f"[green]Committed changes: {message}[/green]")
-            return True
-        except subprocess.CalledProcessError as e:
-            console.print(f"[red]Error committing changes:[/red] {e}")
+        self.console.print(f"[cyan]Running test command: {' '.join(cmd)}[/cyan]")
+        tail = OutputTail(TEST_OUTPUT_TAIL_BYTES)
+        try:
+            process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, stdin=subprocess.DEVNULL, cwd=self.project_path)
+        except FileNotFoundError:
+            self.console.print(f"[red]Test runner not found:[/red] {cmd[0]}")
             return False
 
-    def run_tests(self) -> bool:
-        """Run project tests."""
-        # Look for common test commands
-        test_commands = [
-            ["python", "-m", "pytest"],
-            ["python", "-m", "unittest"],
-            ["npm", "test"],
-            ["yarn", "test"],
-            ["cargo", "test"],
-            ["go", "test", "./..."]
-        ]
-
-        for cmd in test_commands:
-            try:
-                console.print(f"[cyan]Trying test command: {' '.join(cmd)}[/cyan]")
-                result = subprocess.run(
-                    cmd,
-                    capture_output=True,
-                    text=True,
-                    cwd=self.project_path,
-                    timeout=300  # 5 minute timeout
-                )
+        def pump() -> None:
+            with open(log_path, 'wb') as log:
+                for line in process.stdout:
+                    log.write(line)
+                    tail.append(line)
+                    if self.stream_tests:
+                        self.console.print(line.decode("utf-8", "replace").rstrip("\n"), markup=False, highlight=False)
 
-                if result.returncode == 0:
-                    console.print("[green]Tests passed![/green]")
-                    return True
-                else:
-                    console.print(f"[yellow]Tests failed or command not found. Exit code: {result.returncode}[/yellow]")
-                    if result.stdout:
-                        console.print(f"Output: {result.stdout}")
-                    if result.stderr:
-                        console.print(f"Error: {result.stderr}")
-
-            except (subprocess.TimeoutExpired, FileNotFoundError):
-                continue
-            except subprocess.CalledProcessError as e:
-                console.print(f"[red]Error running tests:[/red] {e}")
-                return False
+        reader = threading.Thread(target=pump, name="persona-kit-test-output", daemon=True)
+        reader.start()
+        try:
+            returncode = process.wait(timeout=300)  # 5 minute timeout
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+            returncode = None
+        reader.join()
+        process.stdout.close()
+
+        if returncode == 0:
+            self.console.print(f"[green]Tests passed![/green] [dim](log: {log_path})[/dim]")
+            return True
 
-        console.print("[yellow]No working test command found or all tests failed.[/yellow]")
+        if returncode is None:
+            self.console.print("[red]Tests timed out after 300 seconds.[/red]")
+        else:
+            self.console.print(f"[yellow]Tests failed. Exit code: {returncode}[/yellow]")
+        if not self.stream_tests and tail.size:
+            title = f"Last {TEST_OUTPUT_TAIL_BYTES // 1024} KB of test output" if tail.truncated else "Test output"
+            self.console.print(Panel(Text(tail.text().rstrip()), title=title, border_style="yellow"))
+        self.console.print(f"Full test log: {log_path}")
         return False
 
     def execute_task(self, task: Dict[str, Any], config: Dict[str, Any]) -> bool:
-        """Execute a single implementation task."""
+        """Execute a single implementation task.
+
+        With branch creation enabled the task runs on ``task-<id>``, created
+        from the branch checked out when the task starts; afterwards that
+        branch is checked out again and, if the task succeeded, the task
+        branch is merged into it, as execute_parallel does. Later tasks
+        (including dependents) therefore start from the merged results
+        whatever the number of jobs.
+        """
         task_id = task.get("id", "unknown")
         task_name = task.get("name", "Unnamed task")
         task_description = task.get("description", "")
 
-        console.print(f"\n[bold cyan]Executing Task: {task_name}[/bold cyan]")
+        self.console.print(f"\n[bold cyan]Executing Task: {task_name}[/bold cyan]")
         if task_description:
-            console.print(f"Description: {task_description}")
+            self.console.print(f"Description: {task_description}")
 
-        # Create branch if enabled
-        if config["settings"].get("create_branches", True):
-            branch_name = f"task-{task_id}"
-            if not self.create_branch(branch_name):
+        if not config["settings"].get("create_branches", True):
+            return self.perform_task(task, config)
+
+        status = self.git.status()
+        start = status and (status["branch"] or status["commit"])
+        branch_name = f"task-{task_id}"
+        if not self.create_branch(branch_name, start):
+            return False
+        try:
+            ok = self.perform_task(task, config)
+        finally:
+            try:
+                self.git.checkout(start)
+                self.console.print(f"[green]Switched back to '{start}'[/green]")
+            except (subprocess.CalledProcessError, FileNotFoundError) as e:
+                self.console.print(f"[red]Error:[/red] Could not switch back to '{start}': {e.stderr.strip() if getattr(e, 'stderr', None) else e}")
                 return False
+        if not ok:
+            return False
+
+        merged, message = self.git.merge(branch_name)
+        if not merged:
+            self.console.print(f"[red]Error:[/red] Conflicts merging '{branch_name}' into '{start}'; the branch is left for manual merging")
+            self.console.print(message)
+            return False
+        self.console.print(f"[green]Merged '{branch_name}' into '{start}'[/green]")
+        return True
+
+    def perform_task(self, task: Dict[str, Any], config: Dict[str, Any]) -> bool:
+        """Run a task's implementation steps, tests and commit on the checked-out branch."""
+        task_id = task.get("id", "unknown")
+        task_name = task.get("name", "Unnamed task")
 
         # Execute the task (placeholder for now)
-        console.print("[cyan]Executing implementation steps...[/cyan]")
+        self.console.print("[cyan]Executing implementation steps...[/cyan]")
 
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
-            console=console,
+            console=self.console,
         ) as progress:
 
             # Simulate implementation steps
@@ -267,10 +408,10 @@ class ImplementationManager:
 
         # Run tests if enabled
         if config["settings"].get("run_tests", True):
-            console.print("[cyan]Running tests...[/cyan]")
-            tests_passed = self.run_tests()
+            self.console.print("[cyan]Running tests...[/cyan]")
+            tests_passed = self.run_tests(label=f"task-{task_id}")
             if not tests_passed:
-                console.print("[yellow]Tests failed or not found. Continuing anyway.[/yellow]")
+                self.console.print("[yellow]Tests failed or not found. Continuing anyway.[/yellow]")
 
         # Commit changes if enabled
         if config["settings"].get("auto_commit", True):
@@ -278,74 +419,150 @@ class ImplementationManager:
             if not self.commit_changes(commit_message):
                 return False
 
-        console.print(f"[green]✓ Task '{task_name}' completed successfully![/green]")
+        self.console.print(f"[green]✓ Task '{task_name}' completed successfully![/green]")
         return True
 
+    def execute_parallel(self, scheduler: TaskScheduler, config: Dict[str, Any], jobs: int) -> bool:
+        """Execute scheduled tasks concurrently, each on its own branch in a pooled git worktree.
+
+        Each task starts from the current commit in a worktree from
+        WorktreePool, runs its steps and tests there and is committed on
+        ``task-<id>``, which is merged into the current branch as soon as
+        the task finishes, so dependent tasks start from their
+        dependencies' results. A branch that doesn't merge cleanly is left
+        for the user and counts as failed. Returns True if every task ran
+        and merged.
+        """
+        from rich.live import Live
+        from . import StepTracker
+
+        status = self.git.status()
+        if status is None:
+            self.console.print("[red]Error:[/red] Parallel execution needs a git repository")
+            return False
+        if status["commit"] is None:
+            self.console.print("[red]Error:[/red] Parallel execution needs at least one commit to start the task worktrees from")
+            return False
+        if status["changed"] or status["conflicted"]:
+            self.console.print("[red]Error:[/red] Commit or stash your changes first; task branches are merged back into this working tree")
+            return False
+
+        existing = [f"task-{task_key(task)}" for task in scheduler.tasks.values() if self.git.branch_exists(f"task-{task_key(task)}")]
+        if existing:
+            self.console.print(f"[red]Error:[/red] Branch(es) {', '.join(existing)} already exist; merge or delete them (git branch -D) to run those tasks again")
+            return False
+
+        # Each worktree commits on its own branch, so the branch and commit settings are fixed
+        settings = {**config.get("settings", {}), "create_branches": False, "auto_commit": True}
+        if settings.get("run_tests", True):
+            # Detect once here; workers reuse it unless a task changes the marker files
+            self.test_command()
+        task_config = {**config, "settings": settings}
+        tasks = list(scheduler.tasks.values())
+
+        tracker = StepTracker(f"Execute {len(tasks)} Tasks ({jobs} worktrees)")
+        for task in tasks:
+            tracker.add(task_key(task), task.get("name", "Unnamed task"))
+        logs: Dict[str, str] = {}
+        merge_lock = threading.Lock()
+
+        def run(task: Dict[str, Any]) -> bool:
+            key = task_key(task)
+            branch = f"task-{key}"
+            with merge_lock:
+                base = self.git.status()["commit"]
+            with pool.checkout(branch, base) as worktree:
+                tracker.start(key, f"running in {worktree.path.name}")
+                output = Console(file=io.StringIO(), width=120)
+                try:
+                    ok = ImplementationManager(worktree.path, output, logs_dir=self.logs_dir).execute_task(task, task_config)
+                except Exception as e:
+                    output.print(f"[red]Error:[/red] {e}")
+                    ok = False
+                logs[key] = output.file.getvalue()
+            if not ok:
+                tracker.error(key, "failed")
+                return False
+
+            with merge_lock:
+                merged, message = self.git.merge(branch)
+            if not merged:
+                tracker.error(key, f"conflicts merging {branch}; left unmerged")
+                logs[key] += message
+                return False
+            tracker.complete(key, f"merged {branch}")
+            return True
+
+        def skipped(task: Dict[str, Any], failed: str) -> None:
+            tracker.skip(task_key(task), f"depends on failed task {failed}")
+
+        def crashed(task: Dict[str, Any], error: BaseException) -> None:
+            key = task_key(task)
+            tracker.error(key, f"unexpected error: {error}")
+            logs[key] = logs.get(key, "") + "".join(traceback.format_exception(error))
+
+        try:
+            pool = WorktreePool(self.git, min(jobs, len(tasks))).open(status["commit"])
+        except subprocess.CalledProcessError as e:
+            self.console.print(f"[red]Error creating worktrees:[/red] {e.stderr.strip() if e.stderr else e}")
+            return False
+
+        with Live(tracker.render(), console=self.console, refresh_per_second=8, transient=True) as live:
+            tracker.attach_refresh(lambda: live.update(tracker.render()))
+            results = scheduler.run(run, pool.size, on_skip=skipped, on_error=crashed)
+
+        self.console.print(tracker.render())
+        for key, ok in results.items():
+            if not ok and logs.get(key):
+                self.console.print(Panel(logs[key].strip(), title=f"[red]Task {key}[/red]", border_style="red"))
+        return all(results.values())
+
     def show_status(self) -> None:
         """Show current implementation status."""
         config = self.load_implement_config()
         tasks = self.load_tasks()
 
         # Show settings
-        console.print("[bold]Implementation Settings:[/bold]")
+        self.console.print("[bold]Implementation Settings:[/bold]")
         settings = config.get("settings", {})
         for key, value in settings.items():
             status = "[green]Enabled[/green]" if value else "[red]Disabled[/red]"
-            console.print(f"  {key.replace('_', ' ').title()}: {status}")
+            self.console.print(f"  {key.replace('_', ' ').title()}: {status}")
 
         # Show tasks
         if tasks:
-            console.print(f"\n[bold]Pending Tasks ({len(tasks)}):[/bold]")
+            self.console.print(f"\n[bold]Pending Tasks ({len(tasks)}):[/bold]")
 
             table = Table()
             table.add_column("ID", style="cyan")
             table.add_column("Name", style="white")
             table.add_column("Status", style="yellow")
             table.add_column("Priority", style="red")
+            table.add_column("Depends On", style="dim")
 
             for task in tasks:
                 table.add_row(
                     str(task.get("id", "N/A")),
                     task.get("name", "Unnamed"),
                     task.get("status", "pending"),
-                    str(task.get("priority", "medium"))
+                    str(task.get("priority", "medium")),
+                    ", ".join(map(str, task.get("depends_on") or []))
                 )
 
-            console.print(table)
+            self.console.print(table)
         else:
-            console.print("\n[yellow]No tasks found.[/yellow]")
-            console.print("Use task management tools to create tasks first.")
-
-        # Show git status
-        if self.is_git_repo():
-            try:
-                result = subprocess.run(
-                    ["git", "status", "--porcelain"],
-                    capture_output=True,
-                    text=True,
-                    cwd=self.project_path
-                )
-
-                if result.stdout.strip():
-                    console.print(f"\n[bold]Git Status:[/bold]")
-                    console.print("[yellow]Uncommitted changes detected[/yellow]")
-                else:
-                    console.print(f"\n[bold]Git Status:[/bold]")
-                    console.print("[green]Working directory clean[/green]")
-
-                # Show current branch
-                branch_result = subprocess.run(
-                    ["git", "branch", "--show-current"],
-                    capture_output=True,
-                    text=True,
-                    cwd=self.project_path
-                )
-                current_branch = branch_result.stdout.strip()
-                console.print(f"Current branch: [cyan]{current_branch}[/cyan]")
-
-            except subprocess.CalledProcessError:
-                console.print(f"\n[bold]Git Status:[/bold]")
-                console.print("[red]Error checking git status[/red]")
+            self.console.print("\n[yellow]No tasks found.[/yellow]")
+            self.console.print("Use task management tools to create tasks first.")
+
+        # Show git status (one git call: not a repository when it fails)
+        git_status = self.git.status()
+        if git_status:
+            self.console.print(f"\n[bold]Git Status:[/bold]")
+            if git_status["clean"]:
+                self.console.print("[green]Working directory clean[/green]")
+            else:
+                self.console.print("[yellow]Uncommitted changes detected[/yellow]")
+            self.console.print(f"Current branch: [cyan]{git_status['branch'] or '(detached)'}[/cyan]")
 
 @app.command()
 def status(
@@ -367,11 +584,12 @@ def status(
 
 @app.command()
 def execute(
-    task_id: str = typer.Argument(..., help="ID of the task to execute"),
+    task_id: str = typer.Argument(..., help="ID of the task to execute (comma-separate several, or 'all' for every task not completed)"),
     project_path: str = typer.Argument(".", help="Path to the project directory"),
     force: bool = typer.Option(False, "--force", help="Force execution even if tests fail"),
+    jobs: int = typer.Option(1, "--jobs", "-j", min=1, help="Run up to N tasks at once, each in its own git worktree, and merge the results back"),
 ):
-    """Execute a specific implementation task."""
+    """Execute implementation tasks."""
     project_path = Path(project_path).resolve()
 
     if not project_path.exists():
@@ -383,24 +601,50 @@ def execute(
     if not manager.ensure_project_structure():
         raise typer.Exit(1)
 
-    # Load tasks and find the specified task
+    # Load tasks and find the specified ones
     tasks = manager.load_tasks()
-    task = None
-
-    for t in tasks:
-        if str(t.get("id", "")) == task_id:
-            task = t
-            break
-
-    if not task:
-        console.print(f"[red]Task with ID '{task_id}' not found.[/red]")
+    if task_id == "all":
+        selected = [t for t in tasks if t.get("status", "pending") != "completed"]
+        if not selected:
+            console.print("[yellow]No tasks left to execute.[/yellow]")
+            return
+    else:
+        by_id = {str(t.get("id", "")): t for t in tasks}
+        wanted = [i.strip() for i in task_id.split(",") if i.strip()]
+        missing = [i for i in wanted if i not in by_id]
+        if missing:
+            console.print(f"[red]Task with ID '{', '.join(missing)}' not found.[/red]")
+            raise typer.Exit(1)
+        selected = [by_id[i] for i in wanted]
+
+    # Check dependencies before running anything
+    selected_ids = {task_key(t) for t in selected}
+    completed = [task_key(t) for t in tasks if t.get("status") == "completed" and task_key(t) not in selected_ids]
+    try:
+        scheduler = TaskScheduler(selected, done=completed)
+    except TaskGraphError as e:
+        console.print(f"[red]Error:[/red] Cannot schedule tasks: {e}")
         raise typer.Exit(1)
 
     # Load configuration
     config = manager.load_implement_config()
 
-    # Execute the task
-    success = manager.execute_task(task, config)
+    # Execute the tasks
+    workers = min(jobs, len(selected))
+    if workers > 1:
+        success = manager.execute_parallel(scheduler, config, jobs)
+    else:
+        def skipped(task: Dict[str, Any], failed: str) -> None:
+            console.print(f"[yellow]Skipping task {task_key(task)}: depends on failed task {failed}[/yellow]")
+
+        def crashed(task: Dict[str, Any], error: BaseException) -> None:
+            console.print(f"[red]Task {task_key(task)} failed with an unexpected error:[/red] {error}")
+            console.print(Traceback.from_exception(type(error), error, error.__traceback__))
+
+        success = all(scheduler.run(lambda task: manager.execute_task(task, config), 1, on_skip=skipped, on_error=crashed).values())
+
+    if len(selected) > 1 and scheduler.actual_makespan is not None:
+        console.print(f"\n[bold]Makespan:[/bold] expected {scheduler.expected_makespan(workers):.1f}s with {workers} worker(s) (critical path {scheduler.critical_path:.1f}s), actual {scheduler.actual_makespan:.1f}s")
 
     if success:
         console.print(f"\n[bold green]✓ Task execution completed successfully![/bold green]")
@@ -508,6 +752,10 @@ def validate(
     config = manager.load_implement_config()
     settings = config.get("settings", {})
 
+    test_command = manager.test_command()
+    test_status = f"[green]✓ {' '.join(test_command)}[/green]" if test_command else "[yellow]⚠ No test setup detected[/yellow]"
+    console.print(f"Test Command: {test_status}")
+
     console.print("\n[bold]Configuration Settings:[/bold]")
     for key, value in settings.items():
         status = "[green]Enabled[/green]" if value else "[red]Disabled[/red]"
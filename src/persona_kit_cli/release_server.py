@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+Local release server for Persona Kit CLI.
+
+This module serves a GitHub-compatible ``/repos/{owner}/{repo}/releases/latest``
+endpoint and the release assets from a fixture directory, so the network path
+(release lookup, ranged and resumed downloads, checksum verification) can be
+exercised and benchmarked without internet access. Point the CLI at it with
+PERSONA_KIT_GITHUB_API_URL.
+"""
+
+import json
+import time
+import hashlib
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Optional, Dict, Any, Tuple
+from urllib.parse import quote, unquote, urlsplit
+
+import typer
+from rich.console import Console
+
+from .cache import sha256_file
+
+console = Console()
+
+app = typer.Typer(
+    name="release-server",
+    help="Serve a local stand-in for the GitHub release API",
+    add_completion=False,
+)
+
+CHUNK_SIZE = 64 * 1024
+
+class ReleaseFixture:
+    """Release metadata built from the files in a fixture directory."""
+
+    def __init__(self, root: Path, tag_name: str = "v0.0.0"):
+        self.root = Path(root)
+        self.tag_name = tag_name
+        self.assets: Dict[str, Dict[str, Any]] = {}
+        for path in sorted(self.root.iterdir()):
+            if path.is_file():
+                sha256 = sha256_file(path)
+                self.assets[path.name] = {
+                    "path": path,
+                    "size": path.stat().st_size,
+                    "sha256": sha256,
+                    "etag": f'"{sha256[:32]}"',
+                }
+        digest = hashlib.sha256(tag_name.encode())
+        for name, asset in self.assets.items():
+            digest.update(f"{name}:{asset['sha256']}".encode())
+        self.etag = f'"{digest.hexdigest()[:32]}"'
+
+    def release_json(self, base_url: str) -> Dict[str, Any]:
+        """Return the release document with asset URLs under ``base_url``."""
+        return {
+            "tag_name": self.tag_name,
+            "name": self.tag_name,
+            "assets": [
+                {
+                    "name": name,
+                    "size": asset["size"],
+                    "digest": f"sha256:{asset['sha256']}",
+                    "content_type": "application/zip",
+                    "browser_download_url": f"{base_url}/download/{quote(self.tag_name)}/{quote(name)}",
+                }
+                for name, asset in self.assets.items()
+            ],
+        }
+
+def _parse_range(header: str, size: int) -> Optional[Tuple[int, int]]:
+    """Parse a single ``bytes=start-end`` range into inclusive offsets; None if unsatisfiable."""
+    unit, _, spec = header.partition("=")
+    if unit.strip() != "bytes" or "," in spec:
+        return None
+    start_text, _, end_text = spec.strip().partition("-")
+    try:
+        if start_text:
+            start = int(start_text)
+            end = int(end_text) if end_text else size - 1
+        else:
+            start = max(size - int(end_text), 0)
+            end = size - 1
+    except ValueError:
+        return None
+    end = min(end, size - 1)
+    return (start, end) if 0 <= start <= end else None
+
+class ReleaseRequestHandler(BaseHTTPRequestHandler):
+    """Answers release API and asset requests from the server's fixture."""
+
+    protocol_version = "HTTP/1.1"  # keep-alive, like the real API
+    disable_nagle_algorithm = True  # headers and body go out in separate writes
+    server: "ReleaseServer"
+
+    def do_GET(self):
+        self._dispatch(head=False)
+
+    def do_HEAD(self):
+        self._dispatch(head=True)
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            console.print(f"[dim]{self.address_string()} {format % args}[/dim]")
+
+    def _dispatch(self, head: bool) -> None:
+        if self.server.delay:
+            time.sleep(self.server.delay)
+        parts = [unquote(p) for p in urlsplit(self.path).path.strip("/").split("/")]
+        fixture = self.server.fixture
+        if len(parts) == 5 and parts[0] == "repos" and parts[3:] == ["releases", "latest"]:
+            self._send_release(head)
+        elif len(parts) == 3 and parts[0] == "download" and parts[1] == fixture.tag_name and parts[2] in fixture.assets:
+            self._send_asset(fixture.assets[parts[2]], head)
+        else:
+            self._send_body(404, b'{"message": "Not Found"}', "application/json", head)
+
+    def _send_body(self, status: int, body: bytes, content_type: str, head: bool, headers: Optional[Dict[str, str]] = None) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        if not head:
+            self.wfile.write(body)
+
+    def _send_release(self, head: bool) -> None:
+        fixture = self.server.fixture
+        if self.headers.get("If-None-Match") == fixture.etag:
+            self.send_response(304)
+            self.send_header("ETag", fixture.etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = json.dumps(fixture.release_json(self.server.base_url)).encode()
+        self._send_body(200, body, "application/json", head, {"ETag": fixture.etag})
+
+    def _send_asset(self, asset: Dict[str, Any], head: bool) -> None:
+        size = asset["size"]
+        start, end, status = 0, size - 1, 200
+        range_header = self.headers.get("Range")
+        if_range = self.headers.get("If-Range")
+        if range_header and (if_range is None or if_range == asset["etag"]):
+            byte_range = _parse_range(range_header, size)
+            if byte_range is None:
+                self._send_body(416, b"", "application/octet-stream", head, {"Content-Range": f"bytes */{size}"})
+                return
+            (start, end), status = byte_range, 206
+
+        length = end - start + 1 if size else 0
+        self.send_response(status)
+        self.send_header("Content-Type", "application/zip")
+        self.send_header("Content-Length", str(length))
+        self.send_header("Accept-Ranges", "bytes")
+        self.send_header("ETag", asset["etag"])
+        if status == 206:
+            self.send_header("Content-Range", f"bytes {start}-{end}/{size}")
+        self.end_headers()
+        if head:
+            return
+
+        with open(asset["path"], "rb") as f:
+            f.seek(start)
+            remaining = length
+            while remaining:
+                chunk = f.read(min(CHUNK_SIZE, remaining))
+                if not chunk:
+                    break
+                self.wfile.write(chunk)
+                remaining -= len(chunk)
+
+class ReleaseServer(ThreadingHTTPServer):
+    """Threaded HTTP server for a ReleaseFixture; usable as a context manager.
+
+    ``port=0`` picks a free port; ``base_url`` is the value to put in
+    PERSONA_KIT_GITHUB_API_URL. ``delay`` adds seconds of latency to every
+    request to imitate a slow link.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, fixture: ReleaseFixture, host: str = "127.0.0.1", port: int = 0, *, delay: float = 0.0, verbose: bool = False):
+        super().__init__((host, port), ReleaseRequestHandler)
+        self.fixture = fixture
+        self.delay = delay
+        self.verbose = verbose
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "ReleaseServer":
+        """Serve on a background daemon thread."""
+        self._thread = threading.Thread(target=self.serve_forever, name="persona-kit-release-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and close the socket."""
+        if self._thread:
+            self.shutdown()
+            self._thread.join()
+            self._thread = None
+        self.server_close()
+
+    def __enter__(self) -> "ReleaseServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+@app.command()
+def serve(
+    fixture_dir: Path = typer.Argument(..., exists=True, file_okay=False, help="Directory whose files are published as release assets"),
+    tag: str = typer.Option("v0.0.0", "--tag", help="Release tag name to report"),
+    host: str = typer.Option("127.0.0.1", "--host", help="Interface to bind"),
+    port: int = typer.Option(8765, "--port", help="Port to listen on (0 picks a free port)"),
+    delay: float = typer.Option(0.0, "--delay", min=0.0, help="Seconds of latency added to every request"),
+    verbose: bool = typer.Option(False, "--verbose", help="Log every request"),
+):
+    """Serve FIXTURE_DIR as the latest release of any repository."""
+    fixture = ReleaseFixture(fixture_dir, tag)
+    server = ReleaseServer(fixture, host, port, delay=delay, verbose=verbose)
+    console.print(f"[cyan]Serving {len(fixture.assets)} asset(s) as release {tag} on[/cyan] {server.base_url}")
+    console.print(f"[dim]export PERSONA_KIT_GITHUB_API_URL={server.base_url}[/dim]")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+def main():
+    """Main entry point for release-server command."""
+    app()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Task scheduling for Persona Kit CLI.
+
+Tasks in tasks.json may declare ``depends_on`` (a list of task IDs) and
+``estimated_duration`` (seconds). TaskScheduler checks the dependency graph
+for unknown IDs and cycles before anything runs, then hands ready tasks to
+a worker pool in order of their critical-path length (the longest chain of
+estimated work that still depends on them), so the tasks holding up the
+most work start first.
+"""
+
+import time
+import heapq
+import traceback
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Optional, Dict, Any, List, Callable, Iterable
+
+DEFAULT_DURATION = 1.0
+
+class TaskGraphError(ValueError):
+    """The tasks' dependencies can't be scheduled (unknown task or cycle)."""
+
+def task_key(task: Dict[str, Any]) -> str:
+    """Return a task's ID as used in ``depends_on``."""
+    return str(task.get("id", ""))
+
+def task_duration(task: Dict[str, Any]) -> float:
+    """Return a task's estimated duration in seconds (DEFAULT_DURATION when unset or invalid)."""
+    try:
+        duration = float(task.get("estimated_duration", DEFAULT_DURATION))
+    except (TypeError, ValueError):
+        return DEFAULT_DURATION
+    return duration if duration >= 0 else DEFAULT_DURATION
+
+class TaskScheduler:
+    """Dependency-aware scheduler for a set of tasks.
+
+    ``done`` holds IDs of tasks outside the set that already completed;
+    depending on them is fine, depending on any other task outside the set
+    is an error. Raises TaskGraphError from the constructor.
+    """
+
+    def __init__(self, tasks: List[Dict[str, Any]], done: Iterable[str] = ()):
+        self.tasks: Dict[str, Dict[str, Any]] = {}
+        for position, task in enumerate(tasks, 1):
+            key = task_key(task)
+            if task.get("id") is None or not key:
+                raise TaskGraphError(f"task #{position} ({task.get('name', 'unnamed')}) has no id")
+            if key in self.tasks:
+                raise TaskGraphError(f"task ID {key} is used by more than one task")
+            self.tasks[key] = task
+        done = set(done)
+
+        self.dependencies: Dict[str, List[str]] = {}
+        self.dependents: Dict[str, List[str]] = {key: [] for key in self.tasks}
+        for key, task in self.tasks.items():
+            depends_on = task.get("depends_on") or []
+            if isinstance(depends_on, (str, int)):
+                depends_on = [depends_on]
+            self.dependencies[key] = []
+            for dep in map(str, depends_on):
+                if dep in self.tasks:
+                    self.dependencies[key].append(dep)
+                    self.dependents[dep].append(key)
+                elif dep not in done:
+                    raise TaskGraphError(f"task {key} depends on {dep}, which is neither selected nor completed")
+
+        self.order = self._topological_order()
+        self._position = {key: i for i, key in enumerate(self.tasks)}
+        self.priority: Dict[str, float] = {}
+        for key in reversed(self.order):
+            self.priority[key] = task_duration(self.tasks[key]) + max((self.priority[d] for d in self.dependents[key]), default=0.0)
+        self.actual_makespan: Optional[float] = None
+
+    def _topological_order(self) -> List[str]:
+        indegree = {key: len(deps) for key, deps in self.dependencies.items()}
+        ready = [key for key in self.tasks if indegree[key] == 0]
+        order = []
+        while ready:
+            key = ready.pop(0)
+            order.append(key)
+            for dependent in self.dependents[key]:
+                indegree[dependent] -= 1
+                if indegree[dependent] == 0:
+                    ready.append(dependent)
+        if len(order) != len(self.tasks):
+            raise TaskGraphError(f"dependency cycle: {' -> '.join(self._find_cycle(set(self.tasks) - set(order)))}")
+        return order
+
+    def _find_cycle(self, remaining: set) -> List[str]:
+        """Return one cycle (first node repeated at the end) among tasks Kahn's algorithm couldn't order."""
+        path: List[str] = []
+        key = next(k for k in self.tasks if k in remaining)
+        while key not in path:
+            path.append(key)
+            key = next(dep for dep in self.dependencies[key] if dep in remaining)
+        cycle = path[path.index(key):] + [key]
+        return list(reversed(cycle))
+
+    @property
+    def critical_path(self) -> float:
+        """Return the estimated length of the longest dependency chain (the makespan with unlimited workers)."""
+        return max(self.priority.values(), default=0.0)
+
+    def _ready_entry(self, key: str) -> tuple:
+        # Longest remaining chain first; ties keep the tasks.json order
+        return (-self.priority[key], self._position[key], key)
+
+    def expected_makespan(self, workers: int) -> float:
+        """Return the estimated makespan of running the tasks with ``workers`` workers using this scheduler's policy."""
+        indegree = {key: len(deps) for key, deps in self.dependencies.items()}
+        ready = [self._ready_entry(key) for key in self.tasks if indegree[key] == 0]
+        heapq.heapify(ready)
+        running: List[tuple] = []  # (finish time, key)
+        now = 0.0
+        while ready or running:
+            while ready and len(running) < workers:
+                key = heapq.heappop(ready)[2]
+                heapq.heappush(running, (now + task_duration(self.tasks[key]), key))
+            now, key = heapq.heappop(running)
+            for dependent in self.dependents[key]:
+                indegree[dependent] -= 1
+                if indegree[dependent] == 0:
+                    heapq.heappush(ready, self._ready_entry(dependent))
+        return now
+
+    def run(self, execute: Callable[[Dict[str, Any]], bool], workers: int, on_skip: Optional[Callable[[Dict[str, Any], str], None]] = None, on_error: Optional[Callable[[Dict[str, Any], BaseException], None]] = None) -> Dict[str, bool]:
+        """Run every task with ``execute`` on up to ``workers`` threads, respecting dependencies.
+
+        Tasks whose dependency failed are not run; ``on_skip`` is called with
+        the task and the failed dependency's ID. A task whose ``execute``
+        raises counts as failed and ``on_error`` is called with the task and
+        the exception (without it the traceback is printed to stderr).
+        Returns each task's result (False for failed and skipped tasks) and
+        records the wall-clock makespan in ``actual_makespan``.
+        """
+        indegree = {key: len(deps) for key, deps in self.dependencies.items()}
+        ready = [self._ready_entry(key) for key in self.tasks if indegree[key] == 0]
+        heapq.heapify(ready)
+        results: Dict[str, bool] = {}
+
+        def skip_dependents(key: str, cause: str) -> None:
+            for dependent in self.dependents[key]:
+                if dependent not in results:
+                    results[dependent] = False
+                    if on_skip:
+                        on_skip(self.tasks[dependent], cause)
+                    skip_dependents(dependent, cause)
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=max(workers, 1)) as executor:
+            running = {}
+            while ready or running:
+                while ready and len(running) < workers:
+                    key = heapq.heappop(ready)[2]
+                    running[executor.submit(execute, self.tasks[key])] = key
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    key = running.pop(future)
+                    try:
+                        results[key] = bool(future.result())
+                    except Exception as e:
+                        results[key] = False
+                        if on_error:
+                            on_error(self.tasks[key], e)
+                        else:
+                            traceback.print_exception(e)
+                    if not results[key]:
+                        skip_dependents(key, key)
+                        continue
+                    for dependent in self.dependents[key]:
+                        indegree[dependent] -= 1
+                        if indegree[dependent] == 0 and dependent not in results:
+                            heapq.heappush(ready, self._ready_entry(dependent))
+        self.actual_makespan = time.perf_counter() - start
+        return results
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Template sources for Persona Kit CLI.
+
+This module decides where `init` gets its templates from. The default is the
+GitHub releases of the Persona Kit repository; an internal HTTP mirror, a
+local zip file or an unpacked template directory can be selected with
+``--template-source`` or the PERSONA_KIT_TEMPLATE_SOURCE environment variable.
+"""
+
+import os
+import zipfile
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Optional, Dict, Any, Tuple, Union, BinaryIO
+from urllib.parse import quote, urlsplit
+from urllib.request import url2pathname
+
+import typer
+from rich.console import Console
+
+console = Console()
+
+SOURCE_ENV = "PERSONA_KIT_TEMPLATE_SOURCE"
+MIRROR_RELEASE_FILE = "release.json"
+
+class TemplateSource(ABC):
+    """Where template archives come from.
+
+    ``fetch`` returns ``(archive, metadata)`` like download_template_from_github;
+    ``metadata["local"]`` marks archives owned by the user, which callers
+    must not delete. Remote sources also expose their release document so it
+    can be fetched ahead of time.
+    """
+
+    remote = True
+
+    @abstractmethod
+    def describe(self) -> str:
+        """Return a short description of the source for progress output."""
+
+    def auth_headers(self, github_token: Optional[str] = None) -> Dict[str, str]:
+        """Return headers to send with requests to this source."""
+        return {}
+
+    def release_data(self, client, github_token: Optional[str] = None, *, refresh: bool = False, ttl: Optional[int] = None, raise_errors: bool = False) -> Optional[dict]:
+        """Return the latest release document, or None for local sources."""
+        return None
+
+    @abstractmethod
+    def fetch(self, ai_assistant: str, script_type: str, **options) -> Tuple[Union[Path, BinaryIO], dict]:
+        """Return the template archive for an assistant/script combination."""
+
+class GitHubSource(TemplateSource):
+    """Templates from the GitHub releases of a repository (the default)."""
+
+    def __init__(self, repo_owner: str = "Nom-nom-hub", repo_name: str = "persona-kit"):
+        self.repo_owner = repo_owner
+        self.repo_name = repo_name
+
+    def describe(self) -> str:
+        return f"GitHub {self.repo_owner}/{self.repo_name}"
+
+    def auth_headers(self, github_token: Optional[str] = None) -> Dict[str, str]:
+        from . import _github_auth_headers
+        return _github_auth_headers(github_token)
+
+    def release_data(self, client, github_token: Optional[str] = None, *, refresh: bool = False, ttl: Optional[int] = None, raise_errors: bool = False) -> Optional[dict]:
+        from . import get_release_data
+        return get_release_data(self.repo_owner, self.repo_name, client, github_token, verbose=False, refresh=refresh, ttl=ttl, raise_errors=raise_errors)
+
+    def fetch(self, ai_assistant: str, script_type: str, **options) -> Tuple[Union[Path, BinaryIO], dict]:
+        from . import download_template_from_github
+        return download_template_from_github(ai_assistant, script_type=script_type, repo_owner=self.repo_owner, repo_name=self.repo_name, **options)
+
+class MirrorSource(TemplateSource):
+    """Templates from a static HTTP mirror of a release.
+
+    The mirror serves the GitHub release document as ``release.json`` with
+    the release assets next to it, e.g. ``<base>/persona-kit-template-claude-sh-v1.0.0.zip``.
+    Downloads go through the template cache and checksum verification like
+    GitHub downloads; no GitHub token is sent to the mirror.
+    """
+
+    def __init__(self, base_url: str):
+        self.base_url = base_url.rstrip("/")
+
+    def describe(self) -> str:
+        return f"mirror {self.base_url}"
+
+    def release_data(self, client, github_token: Optional[str] = None, *, refresh: bool = False, ttl: Optional[int] = None, raise_errors: bool = False) -> Optional[dict]:
+        from . import get_release_data
+        data = get_release_data("mirror", "persona-kit", client, verbose=False, refresh=refresh, ttl=ttl, raise_errors=raise_errors, url=f"{self.base_url}/{MIRROR_RELEASE_FILE}", auth_headers=self.auth_headers())
+        assets = [{**asset, "browser_download_url": f"{self.base_url}/{quote(asset['name'])}"} for asset in data.get("assets", [])]
+        return {**data, "assets": assets}
+
+    def fetch(self, ai_assistant: str, script_type: str, **options) -> Tuple[Union[Path, BinaryIO], dict]:
+        from . import download_template_from_github
+        options["github_token"] = None
+        options["auth_headers"] = self.auth_headers()
+        if options.get("release_data") is None and not options.get("offline"):
+            options["release_data"] = self.release_data(options.get("client"), refresh=options.get("refresh", False), ttl=options.get("release_ttl"))
+        return download_template_from_github(ai_assistant, script_type=script_type, **options)
+
+class LocalZipSource(TemplateSource):
+    """A template zip on local disk, used as-is for every assistant."""
+
+    remote = False
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+
+    def describe(self) -> str:
+        return f"zip {self.path}"
+
+    def fetch(self, ai_assistant: str, script_type: str, **options) -> Tuple[Union[Path, BinaryIO], dict]:
+        try:
+            size = self.path.stat().st_size
+        except OSError as e:
+            console.print(f"[red]Template zip not readable:[/red] {self.path} ({e.strerror})")
+            raise typer.Exit(1)
+        if options.get("asset_pattern") and not self._has_agent_package(ai_assistant, script_type):
+            console.print(f"[red]Error:[/red] Several assistants need a complete package zip (with pkg-<agent>-<script>/ folders); {self.path} has no pkg-{ai_assistant}-{script_type}/ folder")
+            raise typer.Exit(1)
+        return self.path, _local_metadata(self.path, size)
+
+    def _has_agent_package(self, ai_assistant: str, script_type: str) -> bool:
+        """Return True if the zip has the complete package layout with the assistant's pkg-<agent>-<script>/ folder."""
+        from . import _archive_root_prefix
+
+        try:
+            with zipfile.ZipFile(self.path) as zip_ref:
+                members = zip_ref.infolist()
+        except (OSError, zipfile.BadZipFile):
+            return False
+        package = _archive_root_prefix(members) + f"pkg-{ai_assistant}-{script_type}/"
+        return any(info.filename.startswith(package) for info in members)
+
+class LocalDirSource(TemplateSource):
+    """An unpacked template directory; new projects are materialized from it directly."""
+
+    remote = False
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+
+    def describe(self) -> str:
+        return f"directory {self.path}"
+
+    def fetch(self, ai_assistant: str, script_type: str, **options) -> Tuple[Union[Path, BinaryIO], dict]:
+        if options.get("asset_pattern"):
+            console.print("[red]Error:[/red] Several assistants need a zip, mirror or GitHub template source; a template directory holds a single template")
+            raise typer.Exit(1)
+        if not self.path.is_dir():
+            console.print(f"[red]Template directory not found:[/red] {self.path}")
+            raise typer.Exit(1)
+        # An unpacked release zip has a single wrapper directory; flatten it like extraction does
+        entries = list(self.path.iterdir())
+        root = entries[0] if len(entries) == 1 and entries[0].is_dir() else self.path
+        return root, _local_metadata(self.path, None)
+
+def _local_metadata(path: Path, size: Optional[int]) -> Dict[str, Any]:
+    return {
+        "filename": path.name,
+        "size": size,
+        "release": "local",
+        "asset_url": None,
+        "sha256": None,
+        "verified": False,
+        "cached": False,
+        "cache_hit": False,
+        "local": True,
+    }
+
+def resolve_template_source(spec: Optional[str] = None) -> TemplateSource:
+    """Build the template source from ``spec`` or PERSONA_KIT_TEMPLATE_SOURCE.
+
+    Accepted forms: ``github`` or ``github:owner/repo`` (the default), an
+    ``http(s)://`` mirror URL, a zip file path or ``file://`` URL, and an
+    unpacked template directory. Raises ValueError for anything else.
+    """
+    spec = (spec or os.getenv(SOURCE_ENV, "")).strip()
+    if not spec or spec == "github":
+        return GitHubSource()
+    if spec.startswith("github:"):
+        owner, _, repo = spec[len("github:"):].partition("/")
+        if not owner or not repo:
+            raise ValueError(f"expected github:<owner>/<repo>, got '{spec}'")
+        return GitHubSource(owner, repo)
+    if spec.startswith(("http://", "https://")):
+        return MirrorSource(spec)
+
+    path = Path(url2pathname(urlsplit(spec).path)) if spec.startswith("file://") else Path(spec).expanduser()
+    if path.is_dir():
+        return LocalDirSource(path)
+    if path.is_file():
+        return LocalZipSource(path)
+    raise ValueError(f"template source not found: {spec}")
+
+def load_template_source(spec: Optional[str] = None) -> TemplateSource:
+    """resolve_template_source for commands: report an invalid source and exit."""
+    try:
+        return resolve_template_source(spec)
+    except ValueError as e:
+        console.print(f"[red]Error:[/red] Invalid template source: {e}")
+        raise typer.Exit(1)
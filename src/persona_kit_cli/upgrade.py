@@ -0,0 +1,351 @@
+#!/usr/bin/env python3
+"""
+Upgrade command module for Persona Kit CLI.
+
+`init` records every template file it installs, with its sha256 digest, in
+.persona-kit/manifest.json. `persona-kit upgrade` fetches the latest release
+and uses that manifest to touch only the files the release changed: files
+still as installed are replaced, locally modified files are three-way merged
+against the previously installed template, and files the release dropped are
+removed unless they were modified.
+"""
+
+import os
+import json
+import time
+import shutil
+import hashlib
+import tempfile
+import zipfile
+import subprocess
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Tuple, Union, BinaryIO, Iterator
+
+import typer
+from rich.console import Console
+from rich.panel import Panel
+
+from .cache import TemplateCache, sha256_file, _write_json_atomic, _open_replacing
+
+console = Console()
+
+app = typer.Typer(
+    name="upgrade",
+    help="Upgrade a project to the latest template release",
+    add_completion=False,
+)
+
+MANIFEST_REL_PATH = Path(".persona-kit") / "manifest.json"
+NEW_FILE_SUFFIX = ".persona-kit-new"
+
+# Upgrade actions and how they are reported
+ACTIONS = {
+    "add": "[green]Added[/green]",
+    "update": "[cyan]Updated[/cyan]",
+    "merge": "[cyan]Merged local changes[/cyan]",
+    "conflict": "[red]Merged with conflicts[/red]",
+    "side-by-side": "[yellow]Modified locally, new version written beside it[/yellow]",
+    "remove": "[cyan]Removed[/cyan]",
+    "keep": "[yellow]Dropped by release, kept (modified locally)[/yellow]",
+    "deleted": "[dim]Deleted locally, not restored[/dim]",
+}
+
+def _manifest_key(rel_path: str) -> str:
+    """Return the platform-independent manifest key for a relative path."""
+    return rel_path.replace(os.sep, "/")
+
+def template_files(archive: Union[Path, BinaryIO], select=None) -> Iterator[Tuple[str, bytes, bool]]:
+    """Yield (manifest key, content, executable) for every file a template installs.
+
+    ``archive`` is a template zip (path or file object) or an unpacked
+    template directory. Zip members are flattened and filtered the way
+    extract_template_members does, so the keys match the installed project;
+    directory files count as executable like extract_template_archive makes
+    them (execute bit set, or a shebang script under .persona-kit/scripts).
+    """
+    from . import SCRIPTS_REL_PATH, _archive_root_prefix, _member_relpath, _member_wants_exec
+
+    if isinstance(archive, Path) and archive.is_dir():
+        for root, _, names in os.walk(archive):
+            for name in names:
+                path = Path(root) / name
+                rel_path = os.path.relpath(path, archive)
+                data = path.read_bytes()
+                executable = os.name != "nt" and (os.access(path, os.X_OK) or (rel_path.startswith(SCRIPTS_REL_PATH) and rel_path.endswith(".sh") and data[:2] == b"#!"))
+                yield _manifest_key(rel_path), data, executable
+        return
+
+    with zipfile.ZipFile(archive) as zip_ref:
+        members = zip_ref.infolist()
+        prefix = _archive_root_prefix(members)
+        for info in members:
+            if info.is_dir():
+                continue
+            rel_path = _member_relpath(info.filename[len(prefix):])
+            if rel_path and select is not None:
+                rel_path = select(rel_path)
+            if not rel_path:
+                continue
+            data = zip_ref.read(info)
+            yield _manifest_key(rel_path), data, _member_wants_exec(info, rel_path, data[:2])
+
+def write_install_manifest(project_path: Path, archive: Union[Path, BinaryIO], meta: dict, install: Dict[str, Any], select=None, digests: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+    """Record the template files installed in ``project_path`` and their digests.
+
+    ``install`` holds what is needed to fetch the same template again
+    (``ai``, ``script``, ``agents``); the release, asset and archive digest
+    come from the fetch metadata. Pass ``digests`` (manifest key → sha256)
+    when the caller already has them, as extraction records them;
+    otherwise the archive is read again. The manifest is committed with
+    the project, so it is only rewritten when something other than
+    ``installed_at`` changed, and it is written world-readable.
+    """
+    if digests is None:
+        digests = {key: hashlib.sha256(data).hexdigest() for key, data, _ in template_files(archive, select)}
+    files = dict(digests)
+    sha256 = meta.get("sha256")
+    if sha256 is None and isinstance(archive, Path) and archive.is_file():
+        sha256 = sha256_file(archive)
+    manifest = {
+        **install,
+        "release": meta["release"],
+        "asset": meta["filename"],
+        "sha256": sha256,
+        "installed_at": time.time(),
+        "files": files,
+        "version": "1.0",
+    }
+    existing = load_install_manifest(project_path)
+    if existing is not None and {**existing, "installed_at": None} == {**manifest, "installed_at": None}:
+        return existing
+    path = project_path / MANIFEST_REL_PATH
+    _write_json_atomic(path, manifest)
+    # The atomic write's temp file is private (0600); this file belongs to the project
+    os.chmod(path, 0o644)
+    return manifest
+
+def load_install_manifest(project_path: Path) -> Optional[Dict[str, Any]]:
+    """Load a project's install manifest, or None if it has none."""
+    path = project_path / MANIFEST_REL_PATH
+    if not path.exists():
+        return None
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except Exception as e:
+        console.print(f"[yellow]Warning: Could not load install manifest:[/yellow] {e}")
+        return None
+
+def merge_file(local: bytes, base: bytes, new: bytes, labels: Tuple[str, str, str]) -> Optional[Tuple[bytes, bool]]:
+    """Three-way merge file contents with ``git merge-file``.
+
+    Returns (merged content, has conflicts), or None when the contents can't
+    be merged (git missing, binary files).
+    """
+    if not shutil.which("git"):
+        return None
+    with tempfile.TemporaryDirectory(prefix="persona-kit-merge-") as tmp:
+        paths = []
+        for name, data in zip(("local", "base", "new"), (local, base, new)):
+            path = Path(tmp) / name
+            path.write_bytes(data)
+            paths.append(str(path))
+        result = subprocess.run(["git", "merge-file", "-p", "-L", labels[0], "-L", labels[1], "-L", labels[2], *paths], capture_output=True)
+    # The exit status is the number of conflicts; errors are negative (255)
+    if not 0 <= result.returncode <= 127:
+        return None
+    return result.stdout, result.returncode > 0
+
+def _file_digest(path: Path) -> Optional[str]:
+    try:
+        return sha256_file(path) if path.is_file() else None
+    except OSError:
+        return None
+
+def plan_upgrade(project_path: Path, manifest: Dict[str, Any], new_files: Dict[str, Tuple[bytes, bool]], base_archive: Optional[Path], select=None, new_release: str = "new") -> List[Tuple[str, str, Optional[bytes], bool]]:
+    """Work out the upgrade as a list of (key, action, content to write, executable).
+
+    Files whose content the release did not change are left alone, even if
+    modified locally. Changed files are replaced when the local copy is
+    still as installed, and three-way merged (base from ``base_archive``,
+    the previously installed template) when it was modified; without a
+    base the new version is written beside the local file.
+    """
+    installed = manifest.get("files", {})
+    plan = []
+    to_merge = {}
+    for key, (data, executable) in sorted(new_files.items()):
+        new_digest = hashlib.sha256(data).hexdigest()
+        old_digest = installed.get(key)
+        if new_digest == old_digest:
+            continue
+        local_digest = _file_digest(project_path / key)
+        if local_digest == new_digest:
+            continue
+        if local_digest is None:
+            plan.append((key, "deleted" if old_digest else "add", None if old_digest else data, executable))
+        elif local_digest == old_digest:
+            plan.append((key, "update", data, executable))
+        else:
+            to_merge[key] = (data, executable)
+
+    base_files = {}
+    if to_merge and base_archive is not None:
+        base_files = {key: data for key, data, _ in template_files(base_archive, select) if key in to_merge}
+    for key, (data, executable) in to_merge.items():
+        merged = None
+        if key in base_files:
+            labels = (f"{key} (local)", f"{key} ({manifest.get('release', 'installed')})", f"{key} ({new_release})")
+            merged = merge_file((project_path / key).read_bytes(), base_files[key], data, labels)
+        if merged is None:
+            plan.append((key, "side-by-side", data, executable))
+        else:
+            content, conflicted = merged
+            plan.append((key, "conflict" if conflicted else "merge", content, executable))
+
+    for key, old_digest in sorted(installed.items()):
+        if key in new_files:
+            continue
+        local_digest = _file_digest(project_path / key)
+        if local_digest is not None:
+            plan.append((key, "remove" if local_digest == old_digest else "keep", None, False))
+    return plan
+
+def apply_upgrade(project_path: Path, plan: List[Tuple[str, str, Optional[bytes], bool]]) -> int:
+    """Write a planned upgrade into the project; returns the bytes written."""
+    from . import _with_exec_bits
+
+    bytes_written = 0
+    for key, action, data, executable in plan:
+        target = project_path / key
+        if action == "remove":
+            target.unlink()
+            continue
+        if data is None:
+            continue
+        if action == "side-by-side":
+            target = target.with_name(target.name + NEW_FILE_SUFFIX)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        with _open_replacing(target) as f:
+            f.write(data)
+            if executable and os.name != "nt":
+                mode = os.fstat(f.fileno()).st_mode
+                if not mode & 0o111:
+                    os.fchmod(f.fileno(), _with_exec_bits(mode))
+        bytes_written += len(data)
+    return bytes_written
+
+@app.command()
+def upgrade(
+    project_path: str = typer.Argument(".", help="Path to the project directory"),
+    dry_run: bool = typer.Option(False, "--dry-run", help="Show what would change without writing anything"),
+    force: bool = typer.Option(False, "--force", help="Compare against the latest release even if the project is already on it"),
+    skip_tls: bool = typer.Option(False, "--skip-tls", help="Skip SSL/TLS verification (not recommended)"),
+    debug: bool = typer.Option(False, "--debug", help="Show verbose diagnostic output for network and merge failures"),
+    github_token: str = typer.Option(None, "--github-token", help="GitHub token to use for API requests (or set GH_TOKEN or GITHUB_TOKEN environment variable)"),
+    offline: bool = typer.Option(False, "--offline", help="Upgrade to the newest cached template without network access"),
+    refresh: bool = typer.Option(False, "--refresh", help="Ignore cached release information and fetch it from GitHub again"),
+    release_ttl: int = typer.Option(None, "--release-ttl", help="Seconds to reuse cached release information without revalidating"),
+    template_source: str = typer.Option(None, "--template-source", help="Where templates come from: github (default), github:owner/repo, an http(s) mirror URL, a template zip or an unpacked template directory (or set PERSONA_KIT_TEMPLATE_SOURCE)"),
+):
+    """Upgrade a project to the latest release, touching only the files it changed."""
+    from . import COMPLETE_ASSET_PATTERN, ConnectionStats, agent_member_selector, create_http_client
+    from .sources import load_template_source
+
+    project_path = Path(project_path).resolve()
+    if not project_path.exists():
+        console.print(f"[red]Error:[/red] Project path does not exist: {project_path}")
+        raise typer.Exit(1)
+
+    manifest = load_install_manifest(project_path)
+    if manifest is None:
+        console.print(f"[red]Error:[/red] No install manifest at {project_path / MANIFEST_REL_PATH}")
+        console.print("Projects record one when created; run [cyan]persona-kit init --here[/cyan] once to adopt an older project.")
+        raise typer.Exit(1)
+
+    source = load_template_source(template_source)
+    agents = manifest.get("agents") or [manifest["ai"]]
+    ai_assistant, extra_agents = agents[0], agents[1:]
+    script_type = manifest["script"]
+
+    stats = ConnectionStats() if debug else None
+    client = None if offline or not source.remote else create_http_client(verify=not skip_tls, stats=stats)
+    try:
+        archive, meta = source.fetch(
+            ai_assistant,
+            script_type,
+            verbose=debug,
+            show_progress=not offline,
+            client=client,
+            debug=debug,
+            github_token=github_token,
+            offline=offline,
+            refresh=refresh,
+            release_ttl=release_ttl,
+            asset_pattern=COMPLETE_ASSET_PATTERN if extra_agents else None,
+        )
+    except typer.Exit:
+        raise
+    except Exception as e:
+        console.print(f"[red]Error fetching template:[/red] {e}")
+        raise typer.Exit(1)
+    finally:
+        if client is not None:
+            client.close()
+    if stats and stats.hosts:
+        console.print(stats.render())
+
+    try:
+        sha256 = meta.get("sha256")
+        if sha256 is None and isinstance(archive, Path) and archive.is_file():
+            sha256 = sha256_file(archive)
+        if not force and meta["release"] == manifest.get("release") and sha256 and sha256 == manifest.get("sha256"):
+            console.print(f"[green]Already up to date[/green] (release {meta['release']})")
+            return
+
+        select = agent_member_selector(ai_assistant, extra_agents, script_type) if extra_agents else None
+        new_files = {key: (data, executable) for key, data, executable in template_files(archive, select)}
+
+        base = TemplateCache().blob_path(manifest["sha256"]) if manifest.get("sha256") else None
+        if base is not None and not base.exists():
+            base = None
+        plan = plan_upgrade(project_path, manifest, new_files, base, select, meta["release"])
+        bytes_written = 0 if dry_run else apply_upgrade(project_path, plan)
+        if not dry_run:
+            new_digests = {key: hashlib.sha256(data).hexdigest() for key, (data, _) in new_files.items()}
+            write_install_manifest(project_path, archive, {**meta, "sha256": sha256}, {key: manifest[key] for key in ("ai", "script", "agents") if key in manifest}, select, new_digests)
+    except typer.Exit:
+        raise
+    except Exception as e:
+        console.print(f"[red]Error upgrading project:[/red] {e}")
+        if debug:
+            console.print(Panel(str(e), title="Upgrade Error", border_style="red"))
+        raise typer.Exit(1)
+    finally:
+        if not meta["cached"] and not meta.get("local"):
+            if isinstance(archive, Path):
+                archive.unlink(missing_ok=True)
+            else:
+                archive.close()
+
+    counts = {action: 0 for action in ACTIONS}
+    for key, action, _, _ in plan:
+        counts[action] += 1
+        console.print(f"{ACTIONS[action]}: {key}" + (NEW_FILE_SUFFIX if action == "side-by-side" else ""))
+
+    verb = "Would upgrade" if dry_run else "Upgraded"
+    summary = ", ".join(f"{counts[action]} {label}" for action, label in (("add", "added"), ("update", "updated"), ("merge", "merged"), ("conflict", "conflicted"), ("side-by-side", "side by side"), ("remove", "removed")) if counts[action])
+    console.print(f"\n[bold]{verb} {manifest.get('release', 'unknown')} -> {meta['release']}[/bold]: {summary or 'no template files changed'}"
+                  + ("" if dry_run else f" ({bytes_written:,} bytes written)"))
+    if base is None and counts["side-by-side"]:
+        console.print(f"[yellow]The previously installed template is not in the template cache, so modified files could not be merged; review the {NEW_FILE_SUFFIX} files.[/yellow]")
+    if counts["conflict"] and not dry_run:
+        console.print("[yellow]Resolve the conflict markers in the files listed above.[/yellow]")
+        raise typer.Exit(1)
+
+def main():
+    """Main entry point for upgrade command."""
+    app()
+
+if __name__ == "__main__":
+    main()